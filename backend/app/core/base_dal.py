@@ -1,7 +1,11 @@
+import inspect
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from uuid import UUID
 
+from sqlalchemy import bindparam, func, select
+from sqlalchemy import update as sa_update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
@@ -11,6 +15,30 @@ from app.core.base_model import BaseEntity
 T = TypeVar("T", bound=BaseEntity)
 
 
+@lru_cache(maxsize=None)
+def _column_map(model: Type[BaseEntity]) -> Dict[str, Any]:
+    """Map column names to table columns, built once per model"""
+    return {column.name: column for column in model.__table__.columns}
+
+
+@lru_cache(maxsize=256)
+def _filtered_select(model: Type[BaseEntity], fields: tuple, count: bool = False):
+    """Build a select over non-deleted rows with one bound parameter per filter field"""
+    columns = _column_map(model)
+    query = select(func.count()).select_from(model) if count else select(model)
+    query = query.where(columns["is_deleted"] == False)
+    for field in fields:
+        query = query.where(columns[field] == bindparam(field))
+    return query
+
+
+async def _resolve(value):
+    """Await the value when it came from an AsyncSession; sync Session calls return it directly"""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
 class BaseDAL(Generic[T]):
     """Base Data Access Layer with standard CRUD operations"""
 
@@ -23,27 +51,31 @@ class BaseDAL(Generic[T]):
         self.db = session
 
     # CRUD Operations
-    async def get_by_id(self, id: UUID) -> Optional[T]:
-        """Get entity by ID"""
+    async def get_by_id(self, id: UUID, for_update: bool = False) -> Optional[T]:
+        """Get entity by ID, served from the session identity map when already loaded (unless locking FOR UPDATE)"""
         try:
-            return self.db.query(self.model).filter(self.model.id == id, self.model.is_deleted == False).first()
+            db_entity = await _resolve(self.db.get(self.model, id, with_for_update=True if for_update else None))
+            if db_entity and not db_entity.is_deleted:
+                return db_entity
+            return None
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await _resolve(self.db.rollback())
+            raise e
+
+    async def fetch_by_id(self, id: UUID) -> Optional[T]:
+        """Get entity by ID with a fresh query, bypassing the identity map"""
+        try:
+            return await self._get_first(self.get_select().where(self.model.id == id))
+        except SQLAlchemyError as e:
+            await _resolve(self.db.rollback())
             raise e
 
     async def get_all(self, skip: int = 0, limit: int = 100, filters: Optional[Dict[str, Any]] = None) -> List[T]:
         """Get all entities with optional filters"""
         try:
-            query = self.db.query(self.model).filter(self.model.is_deleted == False)
-
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model, field):
-                        query = query.filter(getattr(self.model, field) == value)
-
-            return query.offset(skip).limit(limit).all()
+            return await self._get_all(self._filtered_query(filters).offset(skip).limit(limit))
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await _resolve(self.db.rollback())
             raise e
 
     async def create(self, entity_data: Dict[str, Any]) -> T:
@@ -51,11 +83,11 @@ class BaseDAL(Generic[T]):
         try:
             db_entity = self.model(**entity_data)
             self.db.add(db_entity)
-            self.db.flush()
-            self.db.refresh(db_entity)
+            await _resolve(self.db.flush())
+            await _resolve(self.db.refresh(db_entity))
             return db_entity
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await _resolve(self.db.rollback())
             raise e
 
     async def update(self, id: UUID, update_data: Dict[str, Any]) -> Optional[T]:
@@ -69,44 +101,53 @@ class BaseDAL(Generic[T]):
                 if hasattr(db_entity, field):
                     setattr(db_entity, field, value)
 
-            self.db.flush()
-            self.db.refresh(db_entity)
+            await _resolve(self.db.flush())
+            await _resolve(self.db.refresh(db_entity))
             return db_entity
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await _resolve(self.db.rollback())
+            raise e
+
+    async def update_direct(self, id: UUID, update_data: Dict[str, Any]) -> int:
+        """Update entity columns with a single UPDATE statement, returning the affected row count"""
+        try:
+            stmt = (
+                sa_update(self.model)
+                .where(self.model.id == id, self.model.is_deleted == False)
+                .values(**update_data)
+                .execution_options(synchronize_session="evaluate")
+            )
+            result = await self._execute_query(stmt)
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await _resolve(self.db.rollback())
             raise e
 
     async def delete(self, id: UUID, soft_delete: bool = True) -> bool:
         """Delete entity (soft delete by default)"""
         try:
+            if soft_delete:
+                return await self.update_direct(id, {"is_deleted": True}) > 0
+
             db_entity = await self.get_by_id(id)
             if not db_entity:
                 return False
 
-            if soft_delete:
-                db_entity.is_deleted = True
-                self.db.flush()
-            else:
-                self.db.delete(db_entity)
+            await _resolve(self.db.delete(db_entity))
+            await _resolve(self.db.flush())
 
             return True
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await _resolve(self.db.rollback())
             raise e
 
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count entities with optional filters"""
         try:
-            query = self.db.query(self.model).filter(self.model.is_deleted == False)
-
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model, field):
-                        query = query.filter(getattr(self.model, field) == value)
-
-            return query.count()
+            result = await self._execute_query(self._filtered_query(filters, count=True))
+            return result.scalar() or 0
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await _resolve(self.db.rollback())
             raise e
 
     # Transaction Management
@@ -137,12 +178,20 @@ class BaseDAL(Generic[T]):
         """Get base query for the model"""
         return self.db.query(self.model).filter(self.model.is_deleted == False)
 
+    def get_select(self):
+        """Get base select statement for non-deleted rows of the model"""
+        return select(self.model).where(self.model.is_deleted == False)
+
+    def _filtered_query(self, filters: Optional[Dict[str, Any]] = None, count: bool = False):
+        """Get the cached statement for the given filter fields with their values bound"""
+        columns = _column_map(self.model)
+        values = {field: value for field, value in (filters or {}).items() if field in columns}
+        query = _filtered_select(self.model, tuple(sorted(values)), count)
+        return query.params(**values) if values else query
+
     async def _execute_query(self, query):
         """Execute query - supports both sync and async sessions"""
-        if hasattr(self.db, "execute"):  # AsyncSession
-            return await self.db.execute(query)
-        else:  # Sync Session
-            return self.db.execute(query)
+        return await _resolve(self.db.execute(query))
 
     async def _get_first(self, query):
         """Get first result from query"""
@@ -162,34 +211,21 @@ class BaseDAL(Generic[T]):
 
     async def _begin_transaction(self):
         """Begin transaction"""
-        if hasattr(self.db, "begin"):
-            await self.db.begin()
-        else:
-            self.db.begin()
+        await _resolve(self.db.begin())
 
     async def _commit_transaction(self):
         """Commit transaction"""
-        if hasattr(self.db, "commit"):
-            await self.db.commit()
-        else:
-            self.db.commit()
+        await _resolve(self.db.commit())
 
     async def _rollback_transaction(self):
         """Rollback transaction"""
-        if hasattr(self.db, "rollback"):
-            await self.db.rollback()
-        else:
-            self.db.rollback()
+        await _resolve(self.db.rollback())
 
     async def exists(self, **filters) -> bool:
         """Check if entity exists with given filters"""
         try:
-            query = self.get_query()
-            for field, value in filters.items():
-                if hasattr(self.model, field):
-                    query = query.filter(getattr(self.model, field) == value)
-
-            return query.first() is not None
+            query = self._filtered_query(filters).limit(1)
+            return await self._get_first(query) is not None
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await _resolve(self.db.rollback())
             raise e
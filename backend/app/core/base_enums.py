@@ -1,37 +1,46 @@
 import enum
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=None)
+def _lookups(enum_class) -> tuple:
+    """Value, name and (name, value) lists of an enum, built once per class"""
+    members = list(enum_class)
+    return (
+        [item.value for item in members],
+        [item.name for item in members],
+        [(item.name, item.value) for item in members],
+    )
+
+
+# No custom metaclass: orjson only serializes members of classes whose metaclass is exactly EnumMeta
 class BaseEnum(Enum):
     """Base enum class with automatic value checking"""
 
-    def __contains__(self, value: Any) -> bool:
-        """Check if value is in enum"""
-        return value in [item.value for item in self.__class__]
-
     @classmethod
     def values(cls):
         """Get all enum values"""
-        return [item.value for item in cls]
+        return list(_lookups(cls)[0])
 
     @classmethod
     def names(cls):
         """Get all enum names"""
-        return [item.name for item in cls]
+        return list(_lookups(cls)[1])
 
     @classmethod
     def items(cls):
         """Get (name, value) pairs"""
-        return [(item.name, item.value) for item in cls]
+        return list(_lookups(cls)[2])
 
     @classmethod
     def from_value(cls, value: Any):
         """Get enum item from value"""
-        for item in cls:
-            if item.value == value:
-                return item
-        raise ValueError(f"'{value}' is not a valid {cls.__name__}")
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"'{value}' is not a valid {cls.__name__}") from None
 
     def __str__(self) -> str:
         return str(self.value)
@@ -1,3 +1,6 @@
+import base64
+import os
+from collections import deque
 from datetime import datetime
 from typing import Any, Dict, Generic, List, Optional, TypeVar
 from uuid import UUID, uuid4
@@ -6,6 +9,26 @@ from pydantic import BaseModel, ConfigDict
 from sqlmodel import Field, SQLModel
 
 
+# Pre-encoded 16-char id suffixes; refilled from one os.urandom call per batch.
+# deque.popleft is atomic, so threads never share a suffix, and forked children
+# drop the inherited pool so processes never share one either.
+_OBJECT_ID_BATCH = 256
+_object_id_pool: deque = deque()
+os.register_at_fork(after_in_child=_object_id_pool.clear)
+
+
+def generate_object_id(prefix: str) -> str:
+    """Prefixed 16-char URL-safe random id from 12 bytes of os.urandom"""
+    try:
+        suffix = _object_id_pool.popleft()
+    except IndexError:
+        # 12-byte groups encode to exactly 16 chars, so the batch splits without padding
+        raw = base64.urlsafe_b64encode(os.urandom(12 * _OBJECT_ID_BATCH)).decode()
+        _object_id_pool.extend(raw[i : i + 16] for i in range(16, len(raw), 16))
+        suffix = raw[:16]
+    return prefix + suffix
+
+
 # Base Entity for database models
 class BaseEntity(SQLModel):
     id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
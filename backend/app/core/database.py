@@ -2,7 +2,9 @@ import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from sqlalchemy.pool import NullPool
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, SQLModel, create_engine
 
 from app.core.config import get_settings
@@ -34,16 +36,64 @@ settings = get_settings()
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
-    poolclass=NullPool,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=1200,
+    insertmanyvalues_page_size=500,
 )
 
 # Alias sync_engine for backward compatibility
 sync_engine = engine
 
+# Native async engine (aiomysql) for routes that await every statement
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    echo=settings.DATABASE_ECHO,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=True,
+    insertmanyvalues_page_size=500,
+)
+
+# Session factory; attributes stay loaded after commit instead of being re-fetched
+session_factory = sessionmaker(engine, class_=Session, expire_on_commit=False)
+
+
+def get_pool_status() -> dict:
+    """Connection pool usage for the sync and async engines"""
+    return {
+        name: {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_connections": pool.size() + settings.DATABASE_MAX_OVERFLOW,
+            "status": pool.status(),
+        }
+        for name, pool in (("sync", engine.pool), ("async", async_engine.pool))
+    }
+
+
+async_session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def get_async_session(request: Request = None) -> AsyncGenerator[AsyncSession, None]:
+    """Native async session"""
+    async with async_session_factory() as session:
+        # Published for get_current_user, same as get_session
+        if request is not None:
+            request.state.db_session = session
+        yield session
+
 
-async def get_session() -> AsyncGenerator[Session, None]:
+async def get_session(request: Request = None) -> AsyncGenerator[Session, None]:
     """Async wrapper for sync session to maintain compatibility"""
-    session = Session(engine)
+    session = session_factory()
+    # Published on the request so get_current_user reuses it instead of checking out a second connection
+    if request is not None:
+        request.state.db_session = session
     try:
         yield session
     finally:
@@ -52,7 +102,7 @@ async def get_session() -> AsyncGenerator[Session, None]:
 
 def get_sync_session() -> Session:
     """Get synchronous session for migrations and testing"""
-    return Session(sync_engine)
+    return session_factory()
 
 
 # Alias for backward compatibility
@@ -62,7 +112,7 @@ get_db = get_session
 @asynccontextmanager
 async def get_session_context() -> AsyncGenerator[Session, None]:
     """Async context manager for database sessions"""
-    session = Session(engine)
+    session = session_factory()
     try:
         yield session
         await asyncio.get_event_loop().run_in_executor(None, session.commit)
@@ -97,10 +147,15 @@ def drop_tables_sync():
 __all__ = [
     "engine",
     "sync_engine",
+    "session_factory",
     "get_session",
     "get_db",
     "get_sync_session",
     "get_session_context",
+    "async_engine",
+    "async_session_factory",
+    "get_async_session",
+    "get_pool_status",
     "create_tables",
     "create_tables_sync",
     "drop_tables",
@@ -1,10 +1,9 @@
 import logging
-import traceback
 from functools import wraps
 from typing import Callable
 
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.base_model import APIResponse
@@ -25,6 +24,11 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _error_response(status_code: int, message: str, data=None) -> ORJSONResponse:
+    """Error envelope served with the matching HTTP status"""
+    return ORJSONResponse(APIResponse.error(error_code=status_code, message=message, data=data).model_dump(), status_code=status_code)
+
+
 def handle_exceptions(func: Callable) -> Callable:
     """Decorator to handle exceptions in route functions"""
 
@@ -32,38 +36,31 @@ def handle_exceptions(func: Callable) -> Callable:
     async def wrapper(*args, **kwargs):
         try:
             result = await func(*args, **kwargs)
-            # If result is already APIResponse, return as is
-            if isinstance(result, APIResponse):
+            # If result is already APIResponse or a raw Response, return as is
+            if isinstance(result, (APIResponse, Response)):
                 return result
             # Otherwise wrap in success response
             return APIResponse.success(data=result)
 
         except CustomHTTPException as e:
             logger.warning(f"Custom HTTP exception: {e.message}")
-            return APIResponse.error(error_code=e.status_code, message=e.message, data=e.detail)
+            return _error_response(e.status_code, e.message, e.detail)
 
         except HTTPException as e:
             logger.warning(f"HTTP exception: {e.detail}")
-            return APIResponse.error(error_code=e.status_code, message=str(e.detail))
+            return _error_response(e.status_code, str(e.detail))
 
         except SQLAlchemyError as e:
             logger.error(f"Database error: {str(e)}")
-            return APIResponse.error(
-                error_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=_("database_error"),
-            )
+            return _error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, _("database_error"))
 
         except ValueError as e:
             logger.warning(f"Value error: {str(e)}")
-            return APIResponse.error(error_code=status.HTTP_422_UNPROCESSABLE_ENTITY, message=str(e))
+            return _error_response(status.HTTP_422_UNPROCESSABLE_ENTITY, str(e))
 
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return APIResponse.error(
-                error_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                message=_("internal_server_error"),
-            )
+            logger.exception(f"Unexpected error in {func.__name__}: {str(e)}")
+            return _error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, _("internal_server_error"))
 
     return wrapper
 
@@ -152,8 +149,7 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -
 
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle general exceptions"""
-    logger.error(f"Unexpected error: {str(exc)}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
+    logger.exception(f"Unexpected error: {str(exc)}")
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=APIResponse.error(
@@ -1,7 +1,19 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Coroutine, Optional
+
+import httpx
+import orjson
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from kombu.serialization import register
 
 from app.core.config import settings
 
+# Same wire format as json, encoded/decoded by orjson
+register("orjson", orjson.dumps, orjson.loads, content_type="application/x-orjson", content_encoding="binary")
+
 celery_app = Celery(
     "attendee_fastapi",
     broker=settings.CELERY_BROKER_URL,
@@ -11,12 +23,102 @@ celery_app = Celery(
 
 # Configure Celery
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
+    # Task messages carry only ids; results can carry batch transcripts
+    result_compression="zlib",
     timezone="UTC",
     enable_utc=True,
     result_expires=3600,
+    # Bot runs hold a worker for the whole meeting; reserve one task at a time and
+    # ack only after completion so short tasks are not stuck behind them.
+    # Tasks must therefore be idempotent (run_bot_task checks can_join_meeting first).
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Separate queues so webhook deliveries never wait behind multi-second bot runs
+    task_routes={
+        "app.jobs.tasks.deliver_webhook_task": {"queue": "webhooks", "priority": 0},
+        "app.jobs.tasks.process_utterance_task": {"queue": "transcription"},
+        "app.jobs.tasks.process_utterance_batch_task": {"queue": "transcription"},
+        "app.jobs.tasks.launch_scheduled_bot_task": {"queue": "bots"},
+        "app.jobs.tasks.run_bot_task": {"queue": "bots"},
+        "app.jobs.tasks.restart_bot_pod_task": {"queue": "bots"},
+    },
+    task_queue_max_priority=9,
+    task_default_priority=5,
+    # Redis emulates priorities with one list per step; 0 is consumed first
+    broker_transport_options={"priority_steps": list(range(10)), "queue_order_strategy": "priority"},
 )
 
+# Event loop shared by every task in a worker process
+worker_loop: Optional[asyncio.AbstractEventLoop] = None
+# Outbound HTTP client bound to the worker loop, reused across webhook deliveries
+http_client: Optional[httpx.AsyncClient] = None
+_worker_loop_lock = threading.Lock()
+
+HTTP_TIMEOUT = 30.0
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
+
+@worker_process_init.connect
+def start_worker_loop(**kwargs):
+    """Start the per-process event loop on a background thread"""
+    global worker_loop, http_client
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="celery-worker-loop", daemon=True).start()
+    http_client = asyncio.run_coroutine_threadsafe(_create_http_client(), loop).result()
+    worker_loop = loop
+
+
+@worker_process_init.connect
+def warm_db_pool(**kwargs):
+    """Replace connections inherited from the parent and pre-open a few for the first tasks"""
+    from app.core.database import engine
+
+    engine.dispose(close=False)
+    connections = [engine.connect() for _ in range(min(settings.DATABASE_POOL_WARM_SIZE, settings.DATABASE_POOL_SIZE))]
+    for connection in connections:
+        connection.close()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_worker_loop(**kwargs):
+    """Stop the per-process event loop"""
+    global worker_loop, http_client
+    if worker_loop is not None:
+        if http_client is not None:
+            asyncio.run_coroutine_threadsafe(http_client.aclose(), worker_loop).result(timeout=HTTP_TIMEOUT)
+            http_client = None
+        worker_loop.call_soon_threadsafe(worker_loop.stop)
+        worker_loop = None
+
+
+async def _create_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client from inside the worker loop"""
+    return httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+
+
+@asynccontextmanager
+async def http_client_context() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared HTTP client, or a short-lived one outside a worker process"""
+    if http_client is not None:
+        yield http_client
+        return
+    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
+        yield client
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on the worker loop and wait for its result"""
+    if worker_loop is None:
+        # Thread/solo pools and eager mode never send worker_process_init
+        with _worker_loop_lock:
+            if worker_loop is None:
+                start_worker_loop()
+    return asyncio.run_coroutine_threadsafe(coro, worker_loop).result()
+
+
 celery_app.autodiscover_tasks(["app.jobs"])
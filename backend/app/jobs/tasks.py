@@ -1,24 +1,37 @@
 import asyncio
-import json
 import logging
 
-import httpx
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import select
 
 from app.core.base_enums import (
     BotStates,
+    WebhookTriggerTypes,
 )
 from app.core.database import get_session_context
-from app.jobs.celery_app import celery_app
+from app.jobs.celery_app import celery_app, http_client_context, run_async
 from app.modules.bots.models import (
     Bot,
     CreditTransactionManager,
+    Recording,
     Utterance,
     WebhookDeliveryAttempt,
+    WebhookSubscription,
 )
+from app.modules.projects.models import Project
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on utterances transcribed by one batch task
+UTTERANCE_BATCH_SIZE = 64
+
+# Relationship graphs loaded alongside the root row
+UTTERANCE_CREDENTIALS_LOAD = joinedload(Utterance.recording).joinedload(Recording.bot).joinedload(Bot.project).selectinload(Project.credentials)
+DELIVERY_SECRET_LOAD = joinedload(WebhookDeliveryAttempt.webhook_subscription).joinedload(WebhookSubscription.webhook_secret)
+
+# X-Webhook-Event values per trigger (IntEnum keys also match raw ints)
+WEBHOOK_EVENT_HEADERS = {trigger: trigger.name for trigger in WebhookTriggerTypes}
+
 
 @celery_app.task(bind=True, max_retries=3)
 def process_utterance_task(self, utterance_id: str, transcription_provider: str = "deepgram"):
@@ -33,9 +46,8 @@ def process_utterance_task(self, utterance_id: str, transcription_provider: str
 
         async def _process():
             async with get_session_context() as session:
-                # Get utterance
-                result = await session.exec(select(Utterance).where(Utterance.id == utterance_id))
-                utterance = result.first()
+                # Get utterance with recording -> bot -> project -> credentials
+                utterance = await session.get(Utterance, utterance_id, options=[UTTERANCE_CREDENTIALS_LOAD])
 
                 if not utterance:
                     logger.error(f"Utterance {utterance_id} not found")
@@ -67,9 +79,7 @@ def process_utterance_task(self, utterance_id: str, transcription_provider: str
 
                     # TODO: Implement actual transcription providers
                     # For now, simulate transcription
-                    import time
-
-                    time.sleep(1)  # Simulate API call
+                    await asyncio.sleep(1)  # Simulate API call
 
                     # Mock transcription result
                     mock_transcript = f"Mock transcription for utterance {utterance.object_id}"
@@ -97,7 +107,7 @@ def process_utterance_task(self, utterance_id: str, transcription_provider: str
                     await session.commit()
                     raise
 
-        return asyncio.run(_process())
+        return run_async(_process())
 
     except Exception as e:
         logger.error(f"Error processing utterance {utterance_id}: {str(e)}")
@@ -105,6 +115,87 @@ def process_utterance_task(self, utterance_id: str, transcription_provider: str
         raise self.retry(countdown=60 * (2**self.request.retries), exc=e)
 
 
+@celery_app.task(bind=True, max_retries=3)
+def process_utterance_batch_task(self, utterance_ids: list[str], transcription_provider: str = "deepgram"):
+    """
+    Process transcription for a batch of utterances in one session
+
+    Args:
+        utterance_ids: IDs of utterances to process (at most UTTERANCE_BATCH_SIZE)
+        transcription_provider: Provider to use (deepgram, openai, etc.)
+    """
+    try:
+
+        async def _transcribe(utterance: Utterance) -> dict:
+            if not utterance.has_audio():
+                return {"utterance_id": str(utterance.id), "status": "skipped", "message": "No audio data"}
+
+            if utterance.has_transcription():
+                return {"utterance_id": str(utterance.id), "status": "skipped", "message": "Already transcribed"}
+
+            utterance.increment_attempt_count()
+
+            project = utterance.recording.bot.project
+            credentials = project.get_credentials_by_type(transcription_provider)
+            if not credentials:
+                error_msg = f"No {transcription_provider} credentials found for project {project.id}"
+                utterance.mark_transcription_failed(error_msg)
+                return {"utterance_id": str(utterance.id), "status": "error", "message": error_msg}
+
+            try:
+                # TODO: Implement actual transcription providers (batch endpoint over http_client_context)
+                await asyncio.sleep(1)  # Simulate API call
+
+                mock_transcript = f"Mock transcription for utterance {utterance.object_id}"
+                confidence = 0.85
+
+                utterance.set_transcription(transcript=mock_transcript, confidence=confidence)
+                utterance.clear_audio_blob()
+
+                return {
+                    "utterance_id": str(utterance.id),
+                    "status": "success",
+                    "transcript": mock_transcript,
+                    "confidence": confidence,
+                }
+
+            except Exception as e:
+                error_msg = f"Transcription failed: {str(e)}"
+                utterance.mark_transcription_failed(error_msg)
+                return {"utterance_id": str(utterance.id), "status": "error", "message": error_msg}
+
+        async def _process_batch():
+            async with get_session_context() as session:
+                result = await session.exec(
+                    select(Utterance)
+                    .where(Utterance.id.in_(utterance_ids))
+                    .options(UTTERANCE_CREDENTIALS_LOAD)
+                )
+                utterances = result.unique().all()
+
+                # Transcribe concurrently, then persist every outcome with one commit
+                results = list(await asyncio.gather(*(_transcribe(utterance) for utterance in utterances)))
+                await session.commit()
+
+                found = {str(utterance.id) for utterance in utterances}
+                results.extend({"utterance_id": utterance_id, "status": "error", "message": "Utterance not found"} for utterance_id in utterance_ids if str(utterance_id) not in found)
+
+                logger.info(f"Processed utterance batch of {len(utterance_ids)}")
+                return {"status": "success", "results": results}
+
+        return run_async(_process_batch())
+
+    except Exception as e:
+        logger.error(f"Error processing utterance batch {utterance_ids}: {str(e)}")
+        raise self.retry(countdown=60 * (2**self.request.retries), exc=e)
+
+
+def schedule_utterance_batches(utterance_ids: list[str], transcription_provider: str = "deepgram") -> None:
+    """Enqueue utterances for transcription in batches of UTTERANCE_BATCH_SIZE"""
+    for start in range(0, len(utterance_ids), UTTERANCE_BATCH_SIZE):
+        process_utterance_batch_task.delay(utterance_ids[start : start + UTTERANCE_BATCH_SIZE], transcription_provider)
+
+
 @celery_app.task(bind=True, max_retries=5)
 def deliver_webhook_task(self, delivery_attempt_id: str):
     """
@@ -118,8 +209,7 @@ def deliver_webhook_task(self, delivery_attempt_id: str):
         async def _deliver():
             async with get_session_context() as session:
                 # Get delivery attempt
-                result = await session.exec(select(WebhookDeliveryAttempt).where(WebhookDeliveryAttempt.id == delivery_attempt_id))
-                attempt = result.first()
+                attempt = await session.get(WebhookDeliveryAttempt, delivery_attempt_id, options=[DELIVERY_SECRET_LOAD])
 
                 if not attempt:
                     logger.error(f"Delivery attempt {delivery_attempt_id} not found")
@@ -128,93 +218,72 @@ def deliver_webhook_task(self, delivery_attempt_id: str):
                 subscription = attempt.webhook_subscription
                 webhook_secret = subscription.webhook_secret
 
-                # Mark as pending
+                # Mark as pending; persisted together with the outcome in a single commit
                 attempt.mark_pending()
-                await session.commit()
 
-                try:
-                    # Prepare payload
-                    payload = attempt.payload
-                    payload_json = json.dumps(payload, separators=(",", ":"))
-                    payload_bytes = payload_json.encode("utf-8")
+                async def _fail(error_msg: str, http_status: int = None, response_body: str = None) -> None:
+                    """Record the failure and any retry attempt in one commit, then schedule the retry"""
+                    attempt.mark_failed(error_message=error_msg, http_status=http_status, response_body=response_body)
 
-                    # Generate signature
-                    signature = webhook_secret.generate_signature(payload_bytes)
+                    retry_attempt = None
+                    if attempt.can_retry():
+                        retry_attempt = attempt.create_retry_attempt()
+                        session.add(retry_attempt)
+
+                    await session.commit()
+
+                    # Schedule retry task once its row is committed
+                    if retry_attempt is not None:
+                        deliver_webhook_task.apply_async(
+                            args=[retry_attempt.id],
+                            countdown=60 * (2**attempt.attempt_number),
+                        )
+
+                try:
+                    # Prepare payload and signature
+                    payload_bytes, signature = attempt.get_signed_payload(webhook_secret)
 
                     # Prepare headers
                     headers = {
                         "Content-Type": "application/json",
                         "X-Webhook-Signature": f"sha256={signature}",
-                        "X-Webhook-Event": attempt.webhook_trigger_type.name,
+                        "X-Webhook-Event": WEBHOOK_EVENT_HEADERS[attempt.webhook_trigger_type],
                         "User-Agent": "Attendee-Webhook/1.0",
                     }
 
                     # Send webhook
-                    async with httpx.AsyncClient(timeout=30.0) as client:
+                    async with http_client_context() as client:
                         response = await client.post(subscription.url, content=payload_bytes, headers=headers)
 
-                    # Check if successful (2xx status codes)
-                    if 200 <= response.status_code < 300:
-                        attempt.mark_successful(
-                            http_status=response.status_code,
-                            response_body=response.text[:10000],  # Limit size
-                        )
-                        await session.commit()
-
-                        logger.info(f"Webhook delivered successfully: {delivery_attempt_id}")
-                        return {
-                            "status": "success",
-                            "status_code": response.status_code,
-                            "attempt_id": delivery_attempt_id,
-                        }
-                    else:
-                        # Mark as failed
-                        error_msg = f"HTTP {response.status_code}"
-                        attempt.mark_failed(
-                            error_message=error_msg,
-                            http_status=response.status_code,
-                            response_body=response.text[:10000],
-                        )
-                        await session.commit()
-
-                        # Schedule retry if possible
-                        if attempt.can_retry():
-                            retry_attempt = attempt.create_retry_attempt()
-                            session.add(retry_attempt)
-                            await session.commit()
-
-                            # Schedule retry task
-                            deliver_webhook_task.apply_async(
-                                args=[retry_attempt.id],
-                                countdown=60 * (2**attempt.attempt_number),
-                            )
-
-                        return {
-                            "status": "failed",
-                            "status_code": response.status_code,
-                            "error": error_msg,
-                        }
-
                 except Exception as e:
-                    error_msg = f"Request failed: {str(e)}"
-                    attempt.mark_failed(error_message=error_msg)
+                    await _fail(f"Request failed: {str(e)}")
+                    raise
+
+                # Check if successful (2xx status codes)
+                if 200 <= response.status_code < 300:
+                    attempt.mark_successful(
+                        http_status=response.status_code,
+                        response_body=response.text[:10000],  # Limit size
+                    )
                     await session.commit()
 
-                    # Schedule retry if possible
-                    if attempt.can_retry():
-                        retry_attempt = attempt.create_retry_attempt()
-                        session.add(retry_attempt)
-                        await session.commit()
+                    logger.info(f"Webhook delivered successfully: {delivery_attempt_id}")
+                    return {
+                        "status": "success",
+                        "status_code": response.status_code,
+                        "attempt_id": delivery_attempt_id,
+                    }
 
-                        # Schedule retry task
-                        deliver_webhook_task.apply_async(
-                            args=[retry_attempt.id],
-                            countdown=60 * (2**attempt.attempt_number),
-                        )
+                error_msg = f"HTTP {response.status_code}"
+                await _fail(error_msg, http_status=response.status_code, response_body=response.text[:10000])
 
-                    raise
+                return {
+                    "status": "failed",
+                    "status_code": response.status_code,
+                    "error": error_msg,
+                }
 
-        return asyncio.run(_deliver())
+        return run_async(_deliver())
 
     except Exception as e:
         logger.error(f"Error delivering webhook {delivery_attempt_id}: {str(e)}")
@@ -235,8 +304,7 @@ def launch_scheduled_bot_task(self, bot_id: str):
         async def _launch():
             async with get_session_context() as session:
                 # Get bot
-                result = await session.exec(select(Bot).where(Bot.id == bot_id))
-                bot = result.first()
+                bot = await session.get(Bot, bot_id)
 
                 if not bot:
                     logger.error(f"Bot {bot_id} not found")
@@ -273,7 +341,7 @@ def launch_scheduled_bot_task(self, bot_id: str):
                     "message": "Bot launch initiated",
                 }
 
-        return asyncio.run(_launch())
+        return run_async(_launch())
 
     except Exception as e:
         logger.error(f"Error launching scheduled bot {bot_id}: {str(e)}")
@@ -293,8 +361,7 @@ def run_bot_task(self, bot_id: str):
         async def _run():
             async with get_session_context() as session:
                 # Get bot
-                result = await session.exec(select(Bot).where(Bot.id == bot_id))
-                bot = result.first()
+                bot = await session.get(Bot, bot_id)
 
                 if not bot:
                     logger.error(f"Bot {bot_id} not found")
@@ -318,11 +385,9 @@ def run_bot_task(self, bot_id: str):
                     # 5. Participant tracking
 
                     # For now, simulate bot lifecycle
-                    import time
-
                     # Simulate joining
                     logger.info(f"Bot {bot_id} joining meeting: {bot.meeting_url}")
-                    time.sleep(2)
+                    await asyncio.sleep(2)
 
                     # Mark as joined and recording
                     bot.join_meeting(recording=True)
@@ -331,7 +396,7 @@ def run_bot_task(self, bot_id: str):
 
                     # Simulate meeting duration
                     logger.info(f"Bot {bot_id} recording meeting...")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
 
                     # End meeting
                     bot.end_meeting()
@@ -361,7 +426,7 @@ def run_bot_task(self, bot_id: str):
                     await session.commit()
                     raise
 
-        return asyncio.run(_run())
+        return run_async(_run())
 
     except Exception as e:
         logger.error(f"Error running bot {bot_id}: {str(e)}")
@@ -381,8 +446,7 @@ def restart_bot_pod_task(self, bot_id: str):
         async def _restart():
             async with get_session_context() as session:
                 # Get bot
-                result = await session.exec(select(Bot).where(Bot.id == bot_id))
-                bot = result.first()
+                bot = await session.get(Bot, bot_id)
 
                 if not bot:
                     logger.error(f"Bot {bot_id} not found")
@@ -396,9 +460,7 @@ def restart_bot_pod_task(self, bot_id: str):
                 logger.info(f"Restarting pod {pod_name} for bot {bot_id}")
 
                 # Simulate restart
-                import time
-
-                time.sleep(2)
+                await asyncio.sleep(2)
 
                 return {
                     "status": "success",
@@ -407,7 +469,7 @@ def restart_bot_pod_task(self, bot_id: str):
                     "message": "Pod restart completed",
                 }
 
-        return asyncio.run(_restart())
+        return run_async(_restart())
 
     except Exception as e:
         logger.error(f"Error restarting pod for bot {bot_id}: {str(e)}")
@@ -1,10 +1,14 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import APIRouter, FastAPI
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 
 from app.core.database import create_tables
 from app.exceptions.handlers import setup_exception_handlers
+from app.middlewares.compression_middleware import setup_compression_middleware
 from app.middlewares.cors_middleware import setup_cors_middleware
 from app.middlewares.logging_middleware import setup_logging_middleware
 from app.modules.bots.routes.v1.admin_bot_routes import router as admin_bot_router
@@ -38,6 +42,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Warning: Could not create database tables: {e}")
         print("Server will continue without database...")
+    # Build and encode the OpenAPI schema once, after every router is registered
+    app.state.openapi_bytes = orjson.dumps(app.openapi())
     yield
     # Shutdown
 
@@ -47,14 +53,45 @@ app = FastAPI(
     description="API for managing meeting bots and integrations with Clean Architecture",
     version="0.1.0",
     lifespan=lifespan,
+    # Served from the bytes precomputed in lifespan instead of FastAPI's default route
+    openapi_url=None,
 )
 
+OPENAPI_URL = "/openapi.json"
+SWAGGER_OAUTH2_REDIRECT_URL = "/docs/oauth2-redirect"
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json():
+    """Serve the precomputed OpenAPI schema"""
+    return Response(app.state.openapi_bytes, media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui_html():
+    """Swagger UI backed by the precomputed schema"""
+    return get_swagger_ui_html(openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI", oauth2_redirect_url=SWAGGER_OAUTH2_REDIRECT_URL)
+
+
+@app.get(SWAGGER_OAUTH2_REDIRECT_URL, include_in_schema=False)
+async def swagger_ui_redirect():
+    """Swagger UI OAuth2 redirect"""
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc_html():
+    """ReDoc backed by the precomputed schema"""
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 # Setup middlewares
 setup_cors_middleware(app)
 setup_logging_middleware(app)
+# Added last so it is outermost and compresses the final response body
+setup_compression_middleware(app)
 # setup_auth_middleware(app, settings.SECRET_KEY)  # Uncomment when ready
 
 # Setup exception handlers
@@ -74,19 +111,22 @@ async def health_check():
 # Import and include routes with clean architecture
 
 # Include routers with Clean Architecture
-app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
+# Starlette matches routes in registration order, so the busiest prefixes go first
+app.include_router(bot_router, prefix="/api/v1/bots", tags=["Bots"])
+app.include_router(job_router, prefix="/api/v1/jobs", tags=["Jobs"])
 app.include_router(user_router, prefix="/api/v1/users", tags=["Users"])
 app.include_router(organization_router, prefix="/api/v1/organizations", tags=["Organizations"])
 app.include_router(project_router, prefix="/api/v1/projects", tags=["Projects"])
-app.include_router(bot_router, prefix="/api/v1/bots", tags=["Bots"])
-app.include_router(job_router, prefix="/api/v1/jobs", tags=["Jobs"])
+app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
 
 # Admin API endpoints - distributed across modules
-app.include_router(admin_system_router, prefix="/api/v1", tags=["Admin - System"])
-app.include_router(admin_user_router, prefix="/api/v1", tags=["Admin - Users"])
-app.include_router(admin_bot_router, prefix="/api/v1", tags=["Admin - Bots"])
-app.include_router(admin_organization_router, prefix="/api/v1", tags=["Admin - Organizations"])
-app.include_router(admin_project_router, prefix="/api/v1", tags=["Admin - Projects"])
+admin_router = APIRouter(prefix="/api/v1")
+admin_router.include_router(admin_system_router, tags=["Admin - System"])
+admin_router.include_router(admin_user_router, tags=["Admin - Users"])
+admin_router.include_router(admin_bot_router, tags=["Admin - Bots"])
+admin_router.include_router(admin_organization_router, tags=["Admin - Organizations"])
+admin_router.include_router(admin_project_router, tags=["Admin - Projects"])
+app.include_router(admin_router)
 
 # WebSocket router
 app.include_router(websocket_router, prefix="/api/v1/websocket", tags=["WebSocket"])
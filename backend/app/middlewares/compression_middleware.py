@@ -0,0 +1,14 @@
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+
+from app.core.config import settings
+
+
+def setup_compression_middleware(app: FastAPI):
+    """Setup gzip compression for responses above the configured size"""
+
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compresslevel=settings.GZIP_COMPRESS_LEVEL,
+    )
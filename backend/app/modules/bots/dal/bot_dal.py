@@ -1,16 +1,47 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Final, List, Optional, Tuple
+from uuid import UUID
 
+from cachetools import TTLCache
+from sqlalchemy import Row, text, tuple_
+from sqlalchemy.orm import defer, raiseload
 from sqlmodel import func, select
 
 from app.core.base_dal import BaseDAL
 from app.modules.bots.models.bot_model import Bot, BotEvent, BotEventType, BotState
+from app.modules.projects.models import Project
+
+# States in which a bot is in (or joining) a meeting and should be heartbeating
+_HEARTBEAT_BOT_STATES: Final = (
+    BotState.JOINING,
+    BotState.JOINED_NOT_RECORDING,
+    BotState.JOINED_RECORDING,
+    BotState.JOINED_RECORDING_PAUSED,
+)
+_ACTIVE_BOT_STATES: Final = _HEARTBEAT_BOT_STATES + (BotState.WAITING_ROOM,)
+
+# Columns emitted by the admin bot listing; selected directly instead of full ORM rows
+_ADMIN_LIST_COLUMNS: Final = (
+    Bot.id,
+    Bot.name,
+    Bot.meeting_url,
+    Bot.project_id,
+    Bot.state,
+    Bot.meeting_uuid,
+    Bot.join_at,
+    Bot.create_date.label("created_at"),
+    Bot.update_date.label("updated_at"),
+)
+
+# Short-lived per-project bot counts for callers that accept a stale value
+_project_count_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
 
 
 class BotDAL(BaseDAL[Bot]):
     """Bot Data Access Layer"""
 
     def __init__(self):
-        super().__init__(Bot)
+        super().__init__(None, Bot)
 
     async def get_by_object_id(self, object_id: str) -> Optional[Bot]:
         """Get bot by object_id"""
@@ -19,9 +50,30 @@ class BotDAL(BaseDAL[Bot]):
 
     async def get_by_project_id(self, project_id: str) -> List[Bot]:
         """Get bots by project ID"""
-        query = select(self.model).where(self.model.project_id == project_id, ~self.model.is_deleted).order_by(self.model.created_at.desc())
+        query = select(self.model).where(self.model.project_id == project_id, ~self.model.is_deleted).order_by(self.model.create_date.desc())
         return await self._get_all(query)
 
+    async def get_project_page(self, project_id: str, skip: int = 0, limit: int = 20, state: Optional[BotState] = None, search: Optional[str] = None) -> Tuple[List[Bot], int]:
+        """Get a page of a project's bots, newest first, with the filtered total from the same query"""
+        clauses = [self.model.project_id == project_id, ~self.model.is_deleted]
+        if state:
+            clauses.append(self.model.state == state)
+        if search:
+            clauses.append(self.model.name.ilike(f"%{search}%"))
+
+        # COUNT(*) OVER () carries the total on every row, saving a separate COUNT round-trip.
+        # List items never read the JSON columns, so they are left unfetched.
+        query = select(self.model, func.count().over().label("total_count")).where(*clauses).options(defer(self.model.settings, raiseload=True), defer(self.model.metadata_, raiseload=True), raiseload("*")).order_by(self.model.create_date.desc(), self.model.id.desc()).offset(skip).limit(limit)
+        rows = (await self._execute_query(query)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+
+        # Past the last page there are no rows to carry the total
+        if not skip:
+            return [], 0
+        result = await self._execute_query(select(func.count()).select_from(self.model).where(*clauses))
+        return [], result.scalar_one()
+
     async def get_by_state(self, state: BotState, project_id: Optional[str] = None) -> List[Bot]:
         """Get bots by state"""
         query = select(self.model).where(self.model.state == state, ~self.model.is_deleted)
@@ -29,24 +81,16 @@ class BotDAL(BaseDAL[Bot]):
         if project_id:
             query = query.where(self.model.project_id == project_id)
 
-        return await self._get_all(query.order_by(self.model.created_at.desc()))
+        return await self._get_all(query.order_by(self.model.create_date.desc()))
 
     async def get_active_bots(self, project_id: Optional[str] = None) -> List[Bot]:
         """Get all active bots"""
-        active_states = [
-            BotState.JOINING,
-            BotState.JOINED_NOT_RECORDING,
-            BotState.JOINED_RECORDING,
-            BotState.JOINED_RECORDING_PAUSED,
-            BotState.WAITING_ROOM,
-        ]
-
-        query = select(self.model).where(self.model.state.in_(active_states), ~self.model.is_deleted)
+        query = select(self.model).where(self.model.state.in_(_ACTIVE_BOT_STATES), ~self.model.is_deleted)
 
         if project_id:
             query = query.where(self.model.project_id == project_id)
 
-        return await self._get_all(query.order_by(self.model.created_at.desc()))
+        return await self._get_all(query.order_by(self.model.create_date.desc()))
 
     async def get_recording_bots(self, project_id: Optional[str] = None) -> List[Bot]:
         """Get bots that are currently recording"""
@@ -63,14 +107,21 @@ class BotDAL(BaseDAL[Bot]):
 
     async def get_by_meeting_url(self, meeting_url: str) -> List[Bot]:
         """Get bots by meeting URL"""
-        query = select(self.model).where(self.model.meeting_url == meeting_url, ~self.model.is_deleted).order_by(self.model.created_at.desc())
+        query = select(self.model).where(self.model.meeting_url == meeting_url, ~self.model.is_deleted).order_by(self.model.create_date.desc())
         return await self._get_all(query)
 
-    async def count_by_project(self, project_id: str) -> int:
-        """Count bots by project"""
-        query = select(func.count(self.model.id)).where(self.model.project_id == project_id, ~self.model.is_deleted)
+    async def count_by_project(self, project_id: str, precise: bool = True) -> int:
+        """Count bots by project; imprecise counts may be up to 30 seconds old"""
+        if not precise:
+            cached = _project_count_cache.get(project_id)
+            if cached is not None:
+                return cached
+
+        query = select(func.count()).select_from(self.model).where(self.model.project_id == project_id, ~self.model.is_deleted)
         result = await self._execute_query(query)
-        return result.scalar() or 0
+        count = result.scalar_one()
+        _project_count_cache[project_id] = count
+        return count
 
     async def get_bots_without_heartbeat(self, minutes: int = 5) -> List[Bot]:
         """Get active bots without recent heartbeat"""
@@ -79,46 +130,98 @@ class BotDAL(BaseDAL[Bot]):
         cutoff_time = int(time.time()) - (minutes * 60)
 
         query = select(self.model).where(
-            self.model.state.in_(
-                [
-                    BotState.JOINING,
-                    BotState.JOINED_NOT_RECORDING,
-                    BotState.JOINED_RECORDING,
-                    BotState.JOINED_RECORDING_PAUSED,
-                ]
-            ),
+            self.model.state.in_(_HEARTBEAT_BOT_STATES),
             self.model.last_heartbeat_timestamp < cutoff_time,
             ~self.model.is_deleted,
         )
         return await self._get_all(query)
 
     async def get_all_bots(self, skip: int = 0, limit: int = 20) -> List[Bot]:
-        """Get all bots with pagination for admin"""
-        query = select(self.model).where(~self.model.is_deleted).order_by(self.model.created_at.desc()).offset(skip).limit(limit)
+        """Get a page of bots for admin, newest first"""
+        # The admin listing serializes columns only; fail fast on any relationship access
+        query = select(self.model).where(~self.model.is_deleted).options(raiseload("*")).order_by(self.model.create_date.desc(), self.model.id.desc()).offset(skip).limit(limit)
         return await self._get_all(query)
 
-    async def count_all_bots(self) -> int:
-        """Count all bots"""
-        query = select(func.count(self.model.id)).where(~self.model.is_deleted)
+    def _admin_filters(self, state: Optional[str] = None, search: Optional[str] = None, project_id: Optional[str] = None, organization_id: Optional[str] = None) -> list:
+        """WHERE clauses shared by the admin listing and its count"""
+        clauses = [~self.model.is_deleted]
+        if project_id:
+            clauses.append(self.model.project_id == project_id)
+        if state:
+            clauses.append(self.model.state == state)
+        if search:
+            clauses.append(self.model.name.ilike(f"%{search}%"))
+        if organization_id:
+            clauses.append(self.model.project_id.in_(select(Project.id).where(Project.organization_id == organization_id)))
+        return clauses
+
+    async def get_admin_rows(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        state: Optional[str] = None,
+        search: Optional[str] = None,
+        project_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Row]:
+        """Get a page of admin listing columns as Core rows, newest first; a cursor seeks past the previous page instead of skipping"""
+        query = select(*_ADMIN_LIST_COLUMNS).where(*self._admin_filters(state, search, project_id, organization_id))
+
+        if cursor:
+            # Keyset pagination: seek past the last row instead of scanning skipped rows
+            query = query.where(tuple_(self.model.create_date, self.model.id) < tuple_(*cursor))
+        elif skip:
+            query = query.offset(skip)
+
+        query = query.order_by(self.model.create_date.desc(), self.model.id.desc()).limit(limit)
+        result = await self._execute_query(query)
+        return result.all()
+
+    async def count_admin(self, state: Optional[str] = None, search: Optional[str] = None, project_id: Optional[str] = None, organization_id: Optional[str] = None) -> int:
+        """Count bots matching the admin listing filters"""
+        query = select(func.count()).select_from(self.model).where(*self._admin_filters(state, search, project_id, organization_id))
         result = await self._execute_query(query)
-        return result.scalar() or 0
+        return result.scalar_one()
+
+    async def count_all_bots(self, precise: bool = True) -> int:
+        """Count all bots; imprecise counts use the InnoDB table statistics"""
+        if not precise:
+            query = text("SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table").bindparams(table=self.model.__tablename__)
+            result = await self._execute_query(query)
+            estimate = result.scalar()
+            if estimate is not None:
+                return int(estimate)
+
+        query = select(func.count()).select_from(self.model).where(~self.model.is_deleted)
+        result = await self._execute_query(query)
+        return result.scalar_one()
 
     async def count_by_state_all(self, state: BotState) -> int:
         """Count bots by state across all projects"""
-        query = select(func.count(self.model.id)).where(self.model.state == state, ~self.model.is_deleted)
+        query = select(func.count()).select_from(self.model).where(self.model.state == state, ~self.model.is_deleted)
         result = await self._execute_query(query)
-        return result.scalar() or 0
+        return result.scalar_one()
 
 
 class BotEventDAL(BaseDAL[BotEvent]):
     """Bot Event Data Access Layer"""
 
     def __init__(self):
-        super().__init__(BotEvent)
+        super().__init__(None, BotEvent)
 
     async def get_by_bot_id(self, bot_id: str, limit: int = 100) -> List[BotEvent]:
         """Get events by bot ID"""
-        query = select(self.model).where(self.model.bot_id == bot_id, ~self.model.is_deleted).order_by(self.model.created_at.desc()).limit(limit)
+        # Event serializers read columns only; fail fast on any per-row relationship load.
+        # The join drops events of soft-deleted bots in the same round-trip
+        query = (
+            select(self.model)
+            .join(Bot, Bot.id == self.model.bot_id)
+            .where(self.model.bot_id == bot_id, ~self.model.is_deleted, ~Bot.is_deleted)
+            .options(raiseload("*"))
+            .order_by(self.model.create_date.desc())
+            .limit(limit)
+        )
         return await self._get_all(query)
 
     async def get_by_event_type(self, event_type: BotEventType, bot_id: Optional[str] = None) -> List[BotEvent]:
@@ -128,7 +231,7 @@ class BotEventDAL(BaseDAL[BotEvent]):
         if bot_id:
             query = query.where(self.model.bot_id == bot_id)
 
-        return await self._get_all(query.order_by(self.model.created_at.desc()))
+        return await self._get_all(query.order_by(self.model.create_date.desc()))
 
     async def get_error_events(self, bot_id: Optional[str] = None) -> List[BotEvent]:
         """Get error events"""
@@ -139,15 +242,15 @@ class BotEventDAL(BaseDAL[BotEvent]):
         if bot_id:
             query = query.where(self.model.bot_id == bot_id)
 
-        return await self._get_all(query.order_by(self.model.created_at.desc()))
+        return await self._get_all(query.order_by(self.model.create_date.desc()))
 
     async def get_latest_event_for_bot(self, bot_id: str) -> Optional[BotEvent]:
         """Get latest event for a bot"""
-        query = select(self.model).where(self.model.bot_id == bot_id, ~self.model.is_deleted).order_by(self.model.created_at.desc()).limit(1)
+        query = select(self.model).where(self.model.bot_id == bot_id, ~self.model.is_deleted).order_by(self.model.create_date.desc()).limit(1)
         return await self._get_first(query)
 
     async def count_events_by_bot(self, bot_id: str) -> int:
         """Count events for a bot"""
-        query = select(func.count(self.model.id)).where(self.model.bot_id == bot_id, ~self.model.is_deleted)
+        query = select(func.count()).select_from(self.model).where(self.model.bot_id == bot_id, ~self.model.is_deleted)
         result = await self._execute_query(query)
-        return result.scalar() or 0
+        return result.scalar_one()
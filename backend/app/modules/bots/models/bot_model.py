@@ -1,15 +1,16 @@
 import math
 import os
-import random
-import string
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlalchemy.dialects.mysql import JSON
 from sqlmodel import Field, Relationship
 
 from app.core.base_enums import BaseEnum, MeetingTypes, RecordingTypes
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
 
 if TYPE_CHECKING:
     from ...projects.models.project_model import Project
@@ -92,7 +93,7 @@ class BotEvent(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "bevt_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("bevt_"),
         unique=True,
         max_length=32,
         index=True,
@@ -133,19 +134,53 @@ class BotEvent(BaseEntity, table=True):
             return None
 
 
+ACTIVE_BOT_STATES = frozenset(
+    {
+        BotState.JOINING,
+        BotState.JOINED_NOT_RECORDING,
+        BotState.JOINED_RECORDING,
+        BotState.JOINED_RECORDING_PAUSED,
+        BotState.WAITING_ROOM,
+    }
+)
+
+JOINABLE_BOT_STATES = frozenset({BotState.READY, BotState.SCHEDULED})
+
+
 class Bot(BaseEntity, table=True):
     __tablename__ = "bots"
+    # MySQL has no partial indexes, so is_deleted is an equality prefix instead.
+    # project_id, meeting_url and state have no single-column index of their own: these
+    # composites cover their lookups (and the project_id foreign key), and every extra
+    # index is more write work on the heartbeat/state UPDATE path.
+    # create_all does not alter existing tables; on an existing database run once:
+    #   ALTER TABLE bots
+    #     DROP INDEX ix_bots_state, DROP INDEX ix_bots_project_id, DROP INDEX ix_bots_meeting_url,
+    #     ADD INDEX ix_bots_active_heartbeat (is_deleted, state, last_heartbeat_timestamp),
+    #     ADD INDEX ix_bots_state_created (is_deleted, state, create_date),
+    #     ADD INDEX ix_bots_project_created (project_id, is_deleted, create_date),
+    #     ADD INDEX ix_bots_project_state_created (project_id, is_deleted, state, create_date),
+    #     ADD INDEX ix_bots_meeting_url_created (meeting_url, is_deleted, create_date),
+    #     ADD INDEX ix_bots_created (is_deleted, create_date, id);
+    __table_args__ = (
+        Index("ix_bots_active_heartbeat", "is_deleted", "state", "last_heartbeat_timestamp"),
+        Index("ix_bots_state_created", "is_deleted", "state", "create_date"),
+        Index("ix_bots_project_created", "project_id", "is_deleted", "create_date"),
+        Index("ix_bots_project_state_created", "project_id", "is_deleted", "state", "create_date"),
+        Index("ix_bots_meeting_url_created", "meeting_url", "is_deleted", "create_date"),
+        Index("ix_bots_created", "is_deleted", "create_date", "id"),
+    )
 
     # Core fields
     name: str = Field(default="My bot", max_length=255)
-    meeting_url: str = Field(max_length=511, index=True)
+    meeting_url: str = Field(max_length=511)
     meeting_uuid: Optional[str] = Field(default=None, max_length=511)
-    state: BotState = Field(default=BotState.READY, index=True)
-    project_id: UUID = Field(foreign_key="project.id", index=True)
+    state: BotState = Field(default=BotState.READY)
+    project_id: UUID = Field(foreign_key="project.id")
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "bot_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("bot_"),
         unique=True,
         max_length=32,
         index=True,
@@ -174,14 +209,7 @@ class Bot(BaseEntity, table=True):
     # Domain/business logic methods
     def is_active(self) -> bool:
         """Check if bot is in an active state"""
-        active_states = [
-            BotState.JOINING,
-            BotState.JOINED_NOT_RECORDING,
-            BotState.JOINED_RECORDING,
-            BotState.JOINED_RECORDING_PAUSED,
-            BotState.WAITING_ROOM,
-        ]
-        return self.state in active_states and not self.is_deleted
+        return self.state in ACTIVE_BOT_STATES and not self.is_deleted
 
     def is_recording(self) -> bool:
         """Check if bot is currently recording"""
@@ -189,12 +217,25 @@ class Bot(BaseEntity, table=True):
 
     def can_join_meeting(self) -> bool:
         """Check if bot can join a meeting"""
-        return self.state in [BotState.READY, BotState.SCHEDULED] and not self.is_deleted
+        return self.state in JOINABLE_BOT_STATES and not self.is_deleted
 
     def can_leave_meeting(self) -> bool:
         """Check if bot can leave a meeting"""
         return self.is_active()
 
+    def _compute_flags(self) -> Tuple[bool, bool, bool, bool, str]:
+        """(is_active, is_recording, can_join, can_leave, display_name) from a single read of state"""
+        state = self.state
+        live = not self.is_deleted
+        active = live and state in ACTIVE_BOT_STATES
+        return (
+            active,
+            state == BotState.JOINED_RECORDING,
+            live and state in JOINABLE_BOT_STATES,
+            active,
+            f"{self.name} ({state.value})",
+        )
+
     def start_joining(self) -> None:
         """Set bot state to joining"""
         self.state = BotState.JOINING
@@ -235,7 +276,7 @@ class Bot(BaseEntity, table=True):
 
     def update_heartbeat(self) -> None:
         """Update last heartbeat timestamp"""
-        current_timestamp = int(self.get_current_time().timestamp())
+        current_timestamp = int(time.time())
         if self.first_heartbeat_timestamp is None:
             self.first_heartbeat_timestamp = current_timestamp
         self.last_heartbeat_timestamp = current_timestamp
@@ -245,16 +286,18 @@ class Bot(BaseEntity, table=True):
         return f"{self.name} ({self.state.value})"
 
     def get_meeting_domain(self) -> Optional[str]:
-        """Extract domain from meeting URL"""
+        """Extract domain from meeting URL, cached on the instance until meeting_url changes"""
         if not self.meeting_url:
             return None
-        try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(self.meeting_url)
-            return parsed.netloc
-        except:
-            return None
+        cached = self.__dict__.get("_meeting_domain")
+        if cached is None or cached[0] is not self.meeting_url:
+            try:
+                domain = urlparse(self.meeting_url).netloc
+            except ValueError:
+                domain = None
+            cached = (self.meeting_url, domain)
+            self.__dict__["_meeting_domain"] = cached
+        return cached[1]
 
     def recording_type(self):
         """Determine recording type from settings"""
@@ -350,7 +393,7 @@ class BotDebugScreenshot(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "shot_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("shot_"),
         unique=True,
         max_length=32,
         index=True,
@@ -1,17 +1,27 @@
-import random
-import string
-from typing import Any, Dict, Optional
+import re
+import time
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from sqlalchemy import Index, insert
 from sqlalchemy.dialects.mysql import JSON
-from sqlmodel import Field, Relationship
+from sqlmodel import Field, Relationship, Session
 
 from app.core.base_enums import ChatMessageToOptions
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
+
+
+# Leading "/" command word, skipping leading whitespace
+_COMMAND_RE = re.compile(r"\s*/(\S*)")
+
+# Process-local UTC offset in seconds, resolved once at import (a DST switch
+# takes effect on restart)
+_LOCAL_UTC_OFFSET = time.localtime().tm_gmtoff
 
 
 class ChatMessage(BaseEntity, table=True):
     __tablename__ = "chat_messages"
+    __table_args__ = (Index("ix_chat_bot_ts", "bot_id", "timestamp_ms"),)
 
     # Core fields
     bot_id: UUID = Field(foreign_key="bots.id", index=True)
@@ -23,7 +33,9 @@ class ChatMessage(BaseEntity, table=True):
 
     # Timing
     timestamp: int = Field(index=True)  # Unix timestamp
-    timestamp_ms: Optional[int] = Field(default=None, index=True)  # Milliseconds timestamp
+    # Milliseconds timestamp, derived from timestamp when omitted. Nullable so rows written
+    # before the column existed stay valid; readers fall back to timestamp * 1000
+    timestamp_ms: Optional[int] = Field(default=None, index=True)
 
     # Sender information
     sender_name: Optional[str] = Field(default=None, max_length=255)
@@ -35,7 +47,7 @@ class ChatMessage(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "msg_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("msg_"),
         unique=True,
         max_length=32,
         index=True,
@@ -45,6 +57,21 @@ class ChatMessage(BaseEntity, table=True):
     bot: "Bot" = Relationship(back_populates="chat_messages")
     participant: Optional["Participant"] = Relationship(back_populates="chat_messages")
 
+    def __init__(self, **kwargs):
+        if kwargs.get("timestamp_ms") is None and kwargs.get("timestamp") is not None:
+            kwargs["timestamp_ms"] = kwargs["timestamp"] * 1000
+        super().__init__(**kwargs)
+
+    @classmethod
+    def bulk_create(cls, session: Session, payloads: List[Dict[str, Any]], batch_size: int = 500) -> int:
+        """Insert many messages with multi-row INSERTs, bypassing the unit of work"""
+        columns = [column.name for column in cls.__table__.columns]
+        for start in range(0, len(payloads), batch_size):
+            # Build through the model so ids, object_ids and field defaults are applied
+            messages = [cls(**payload) for payload in payloads[start : start + batch_size]]
+            session.execute(insert(cls), [{name: getattr(message, name) for name in columns} for message in messages])
+        return len(payloads)
+
     def is_from_bot(self) -> bool:
         """Check if message is from the bot"""
         return (self.participant and self.participant.is_the_bot) or self.sender_name == "Bot"
@@ -65,20 +92,17 @@ class ChatMessage(BaseEntity, table=True):
 
     def get_timestamp_ms(self) -> int:
         """Get timestamp in milliseconds"""
-        if self.timestamp_ms is not None:
-            return self.timestamp_ms
-        return self.timestamp * 1000
+        timestamp_ms = self.timestamp_ms
+        return timestamp_ms if timestamp_ms is not None else self.timestamp * 1000
 
     def get_timestamp_seconds(self) -> float:
         """Get timestamp in seconds"""
         return self.get_timestamp_ms() / 1000.0
 
     def get_formatted_timestamp(self) -> str:
-        """Get formatted timestamp string"""
-        from datetime import datetime
-
-        dt = datetime.fromtimestamp(self.get_timestamp_seconds())
-        return dt.strftime("%H:%M:%S")
+        """Get formatted timestamp string (HH:MM:SS, local time)"""
+        seconds_of_day = (self.get_timestamp_ms() // 1000 + _LOCAL_UTC_OFFSET) % 86400
+        return f"{seconds_of_day // 3600:02d}:{seconds_of_day // 60 % 60:02d}:{seconds_of_day % 60:02d}"
 
     def get_message_preview(self, max_length: int = 100) -> str:
         """Get truncated message preview"""
@@ -88,26 +112,48 @@ class ChatMessage(BaseEntity, table=True):
 
     def is_command(self) -> bool:
         """Check if message looks like a command (starts with /)"""
-        return self.text.strip().startswith("/")
+        return _COMMAND_RE.match(self.text) is not None
 
     def get_command(self) -> Optional[str]:
         """Extract command from message if it's a command"""
-        if not self.is_command():
-            return None
-        return self.text.strip().split()[0][1:]  # Remove the "/" and get first word
+        match = _COMMAND_RE.match(self.text)
+        return match.group(1) if match else None  # First word without the "/"
+
+    def _repr_preview(self) -> str:
+        """30-char preview used by __repr__, cached on the instance until text changes"""
+        cached = self.__dict__.get("_text_preview_30")
+        if cached is None or cached[0] is not self.text:
+            cached = (self.text, self.get_message_preview(30))
+            self.__dict__["_text_preview_30"] = cached
+        return cached[1]
+
+    def _casefolded_text(self) -> str:
+        """Casefolded text, cached on the instance until text changes"""
+        cached = self.__dict__.get("_text_casefold")
+        if cached is None or cached[0] is not self.text:
+            cached = (self.text, self.text.casefold())
+            self.__dict__["_text_casefold"] = cached
+        return cached[1]
 
     def contains_mention(self, name: str) -> bool:
         """Check if message contains a mention of the given name"""
-        return name.lower() in self.text.lower()
+        return name.casefold() in self._casefolded_text()
+
+    @classmethod
+    def filter_mentions(cls, messages: List["ChatMessage"], name: str) -> List["ChatMessage"]:
+        """Get messages mentioning the given name, casefolding the name once"""
+        needle = name.casefold()
+        return [message for message in messages if needle in message._casefolded_text()]
 
     def __repr__(self):
         sender = self.get_sender_display_name()
-        preview = self.get_message_preview(30)
+        preview = self._repr_preview()
         return f"<ChatMessage {self.object_id}: {sender} - '{preview}'>"
 
 
 class BotChatMessageRequest(BaseEntity, table=True):
     __tablename__ = "bot_chat_message_requests"
+    __table_args__ = (Index("ix_bcr_bot_state", "bot_id", "state"),)
 
     # Core fields
     bot_id: UUID = Field(foreign_key="bots.id", index=True)
@@ -123,7 +169,7 @@ class BotChatMessageRequest(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "bcr_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("bcr_"),
         unique=True,
         max_length=32,
         index=True,
@@ -1,8 +1,7 @@
 import base64
 import json
 import os
-import random
-import string
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from uuid import UUID
 
@@ -10,7 +9,25 @@ from cryptography.fernet import Fernet
 from sqlmodel import Field, Relationship
 
 from app.core.base_enums import CredentialTypes
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
+
+
+@lru_cache(maxsize=1)
+def _get_fernet(key: bytes) -> Fernet:
+    """Fernet cipher for the configured key; rebuilt only when the key changes"""
+    return Fernet(base64.urlsafe_b64encode(key[:32]))
+
+
+# Fields each credential type must provide as non-empty strings
+_REQUIRED_CREDENTIAL_FIELDS = {
+    CredentialTypes.DEEPGRAM: ("api_key",),
+    CredentialTypes.OPENAI: ("api_key",),
+    CredentialTypes.GLADIA: ("api_key",),
+    CredentialTypes.ASSEMBLY_AI: ("api_key",),
+    CredentialTypes.SARVAM: ("api_key",),
+    CredentialTypes.ZOOM_OAUTH: ("client_id", "client_secret", "access_token"),
+    CredentialTypes.GOOGLE_TEXT_TO_SPEECH: ("service_account_json",),
+}
 
 
 class Credentials(BaseEntity, table=True):
@@ -29,7 +46,7 @@ class Credentials(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "cred_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("cred_"),
         unique=True,
         max_length=32,
         index=True,
@@ -48,6 +65,7 @@ class Credentials(BaseEntity, table=True):
 
     def set_credentials(self, credentials: Dict[str, Any]) -> None:
         """Encrypt and store credentials"""
+        self.__dict__.pop("_credentials_cache", None)
         if not credentials:
             self.encrypted_credentials = None
             return
@@ -56,7 +74,7 @@ class Credentials(BaseEntity, table=True):
         credentials_json = json.dumps(credentials)
 
         # Encrypt
-        fernet = Fernet(base64.urlsafe_b64encode(self.encryption_key[:32]))
+        fernet = _get_fernet(self.encryption_key)
         encrypted_data = fernet.encrypt(credentials_json.encode())
 
         self.encrypted_credentials = encrypted_data
@@ -66,14 +84,21 @@ class Credentials(BaseEntity, table=True):
         if not self.encrypted_credentials:
             return None
 
+        # Reuse the decrypted dict while the ciphertext is unchanged (kept outside pydantic fields)
+        cached = self.__dict__.get("_credentials_cache")
+        if cached is not None and cached[0] is self.encrypted_credentials:
+            return dict(cached[1])
+
         try:
             # Decrypt
-            fernet = Fernet(base64.urlsafe_b64encode(self.encryption_key[:32]))
+            fernet = _get_fernet(self.encryption_key)
             decrypted_data = fernet.decrypt(self.encrypted_credentials)
 
             # Parse JSON
             credentials_json = decrypted_data.decode()
-            return json.loads(credentials_json)
+            credentials = json.loads(credentials_json)
+            self.__dict__["_credentials_cache"] = (self.encrypted_credentials, credentials)
+            return dict(credentials)
 
         except Exception as e:
             # Log error but don't expose sensitive info
@@ -104,47 +129,13 @@ class Credentials(BaseEntity, table=True):
             return False, "No credentials found"
 
         try:
-            if self.credential_type == CredentialTypes.DEEPGRAM:
-                if "api_key" not in credentials:
-                    return False, "Missing api_key"
-                if not credentials["api_key"].strip():
-                    return False, "api_key is empty"
-
-            elif self.credential_type == CredentialTypes.OPENAI:
-                if "api_key" not in credentials:
-                    return False, "Missing api_key"
-                if not credentials["api_key"].strip():
-                    return False, "api_key is empty"
-
-            elif self.credential_type == CredentialTypes.GLADIA:
-                if "api_key" not in credentials:
-                    return False, "Missing api_key"
-                if not credentials["api_key"].strip():
-                    return False, "api_key is empty"
-
-            elif self.credential_type == CredentialTypes.ASSEMBLY_AI:
-                if "api_key" not in credentials:
-                    return False, "Missing api_key"
-                if not credentials["api_key"].strip():
-                    return False, "api_key is empty"
-
-            elif self.credential_type == CredentialTypes.SARVAM:
-                if "api_key" not in credentials:
-                    return False, "Missing api_key"
-                if not credentials["api_key"].strip():
-                    return False, "api_key is empty"
-
-            elif self.credential_type == CredentialTypes.ZOOM_OAUTH:
-                required_fields = ["client_id", "client_secret", "access_token"]
-                for field in required_fields:
-                    if field not in credentials:
-                        return False, f"Missing {field}"
-                    if not credentials[field].strip():
-                        return False, f"{field} is empty"
-
-            elif self.credential_type == CredentialTypes.GOOGLE_TEXT_TO_SPEECH:
-                if "service_account_json" not in credentials:
-                    return False, "Missing service_account_json"
+            for field in _REQUIRED_CREDENTIAL_FIELDS.get(self.credential_type, ()):
+                if field not in credentials:
+                    return False, f"Missing {field}"
+                if not credentials[field].strip():
+                    return False, f"{field} is empty"
+
+            if self.credential_type == CredentialTypes.GOOGLE_TEXT_TO_SPEECH:
                 # Try to parse as JSON
                 try:
                     json.loads(credentials["service_account_json"])
@@ -1,11 +1,9 @@
-import random
-import string
 from typing import Optional
 from uuid import UUID
 
 from sqlmodel import Field, Relationship
 
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
 
 
 class CreditTransaction(BaseEntity, table=True):
@@ -31,7 +29,7 @@ class CreditTransaction(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "ctr_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("ctr_"),
         unique=True,
         max_length=32,
         index=True,
@@ -1,5 +1,3 @@
-import random
-import string
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
@@ -7,7 +5,7 @@ from sqlalchemy.dialects.mysql import JSON
 from sqlmodel import Field, Relationship
 
 from app.core.base_enums import ParticipantEventTypes
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
 
 
 class Participant(BaseEntity, table=True):
@@ -31,7 +29,7 @@ class Participant(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "par_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("par_"),
         unique=True,
         max_length=32,
         index=True,
@@ -118,7 +116,7 @@ class ParticipantEvent(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "pev_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("pev_"),
         unique=True,
         max_length=32,
         index=True,
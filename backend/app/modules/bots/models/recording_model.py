@@ -1,5 +1,3 @@
-import random
-import string
 from typing import Any, Dict, Optional
 from uuid import UUID
 
@@ -13,7 +11,7 @@ from app.core.base_enums import (
     TranscriptionProviders,
     TranscriptionTypes,
 )
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
 
 
 class Recording(BaseEntity, table=True):
@@ -44,7 +42,7 @@ class Recording(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "rec_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("rec_"),
         unique=True,
         max_length=32,
         index=True,
@@ -1,13 +1,11 @@
 import enum
-import random
-import string
 from typing import Any, Dict, Optional
 from uuid import UUID
 
 from sqlalchemy.dialects.mysql import JSON
 from sqlmodel import Field, Relationship
 
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
 
 
 class UtteranceSource(str, enum.Enum):
@@ -41,7 +39,7 @@ class Utterance(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "utt_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("utt_"),
         unique=True,
         max_length=32,
         index=True,
@@ -1,17 +1,17 @@
 import hashlib
 import hmac
-import random
 import secrets
-import string
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from uuid import UUID
 
+import orjson
 from sqlalchemy.dialects.mysql import JSON
 from sqlmodel import Field, Relationship
 
 from app.core.base_enums import WebhookDeliveryAttemptStatus, WebhookTriggerTypes
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
 
 from ...projects.models.project_model import Project
 
@@ -19,6 +19,12 @@ if TYPE_CHECKING:
     from .bot_model import Bot
 
 
+@lru_cache(maxsize=1024)
+def _hmac_prototype(secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 state per secret; copies skip the key/pad setup"""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
 class WebhookSecret(BaseEntity, table=True):
     __tablename__ = "webhook_secrets"
 
@@ -29,7 +35,7 @@ class WebhookSecret(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "whs_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("whs_"),
         unique=True,
         max_length=32,
         index=True,
@@ -51,7 +57,9 @@ class WebhookSecret(BaseEntity, table=True):
 
     def generate_signature(self, payload: bytes) -> str:
         """Generate HMAC signature for payload"""
-        return hmac.new(self.secret.encode(), payload, hashlib.sha256).hexdigest()
+        mac = _hmac_prototype(self.secret).copy()
+        mac.update(payload)
+        return mac.hexdigest()
 
     def verify_signature(self, payload: bytes, signature: str) -> bool:
         """Verify HMAC signature"""
@@ -77,7 +85,7 @@ class WebhookSubscription(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "whs_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("whs_"),
         unique=True,
         max_length=32,
         index=True,
@@ -154,7 +162,7 @@ class WebhookDeliveryAttempt(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "wda_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("wda_"),
         unique=True,
         max_length=32,
         index=True,
@@ -233,6 +241,15 @@ class WebhookDeliveryAttempt(BaseEntity, table=True):
             attempt_number=self.attempt_number + 1,
         )
 
+    def get_signed_payload(self, webhook_secret: WebhookSecret) -> Tuple[bytes, str]:
+        """Get serialized payload and its signature, cached on the instance until the payload or secret changes"""
+        cached = self.__dict__.get("_signed_payload")
+        if cached is None or cached[0] is not self.payload or cached[1] != webhook_secret.secret:
+            payload_bytes = orjson.dumps(self.payload)
+            cached = (self.payload, webhook_secret.secret, payload_bytes, webhook_secret.generate_signature(payload_bytes))
+            self.__dict__["_signed_payload"] = cached
+        return cached[2], cached[3]
+
     def get_duration_ms(self) -> Optional[int]:
         """Get delivery duration in milliseconds"""
         if not self.attempted_at or not self.completed_at:
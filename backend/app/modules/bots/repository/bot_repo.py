@@ -1,8 +1,17 @@
-from typing import Any, Dict, List, Optional
-
+import base64
+import inspect
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+import orjson
+from cachetools import TTLCache
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Session
 
-from app.core.base_model import PaginatedResponse, PaginationParams
+from app.core.base_model import PaginatedResponse, PaginationParams, PagingInfo
+from app.core.config import settings as app_settings
 from app.exceptions.exception import (
     NotFoundException,
     ValidationException,
@@ -16,11 +25,28 @@ from app.modules.bots.models.bot_model import (
     BotState,
 )
 
+# Bot ids whose heartbeat this process persisted within the write interval
+_heartbeat_written: TTLCache = TTLCache(maxsize=10000, ttl=app_settings.BOT_HEARTBEAT_WRITE_INTERVAL)
+
+
+def _encode_admin_cursor(create_date: datetime, bot_id: UUID) -> str:
+    """Opaque keyset cursor for the admin bot listing"""
+    return base64.urlsafe_b64encode(orjson.dumps([create_date, bot_id])).decode()
+
+
+def _decode_admin_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Parse a cursor from _encode_admin_cursor; malformed cursors surface as a 422"""
+    try:
+        create_date, bot_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(create_date), UUID(bot_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
 
 class BotRepo:
     """Bot Repository - Business Logic Layer"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Union[Session, AsyncSession]):
         self.session = session
         self.bot_dal = BotDAL()
         self.event_dal = BotEventDAL()
@@ -52,21 +78,21 @@ class BotRepo:
             raise ValidationException("bots.validation.invalid_meeting_url")
 
         # Create bot
-        bot = Bot(
-            name=name.strip(),
-            meeting_url=meeting_url.strip(),
-            project_id=project_id,
-            meeting_uuid=meeting_uuid,
-            state=BotState.READY,
-            settings=settings or {},
-            join_at=join_at,
+        return await self.bot_dal.create(
+            {
+                "name": name.strip(),
+                "meeting_url": meeting_url.strip(),
+                "project_id": project_id,
+                "meeting_uuid": meeting_uuid,
+                "state": BotState.READY,
+                "settings": settings or {},
+                "join_at": join_at,
+            }
         )
 
-        return await self.bot_dal.create(bot)
-
-    async def get_bot_by_id(self, bot_id: str) -> Bot:
+    async def get_bot_by_id(self, bot_id: str, for_update: bool = False) -> Bot:
         """Get bot by ID with validation"""
-        bot = await self.bot_dal.get_by_id(bot_id)
+        bot = await self.bot_dal.get_by_id(bot_id, for_update=for_update)
         if not bot:
             raise NotFoundException("bots.errors.not_found")
         return bot
@@ -89,12 +115,13 @@ class BotRepo:
     ) -> Bot:
         """Update bot with validation"""
         bot = await self.get_bot_by_id(bot_id)
+        changes: Dict[str, Any] = {}
 
         # Validate new name if provided
         if name is not None:
             if not name or len(name.strip()) < 2:
                 raise ValidationException("bots.validation.name_too_short")
-            bot.name = name.strip()
+            changes["name"] = name.strip()
 
         # Validate new meeting URL if provided
         if meeting_url is not None:
@@ -102,23 +129,23 @@ class BotRepo:
                 raise ValidationException("bots.validation.meeting_url_required")
             if not self._is_valid_meeting_url(meeting_url.strip()):
                 raise ValidationException("bots.validation.invalid_meeting_url")
-            bot.meeting_url = meeting_url.strip()
+            changes["meeting_url"] = meeting_url.strip()
 
         if meeting_uuid is not None:
-            bot.meeting_uuid = meeting_uuid
+            changes["meeting_uuid"] = meeting_uuid
 
         if settings is not None:
-            bot.settings = settings
+            changes["settings"] = settings
 
         if join_at is not None:
-            bot.join_at = join_at
+            changes["join_at"] = join_at
 
-        return await self.bot_dal.update(bot)
+        return await self.bot_dal.update(bot.id, changes)
 
     async def delete_bot(self, bot_id: str) -> bool:
         """Soft delete bot"""
         bot = await self.get_bot_by_id(bot_id)
-        return await self.bot_dal.delete(bot)
+        return await self.bot_dal.delete(bot.id)
 
     async def get_bots_by_project(
         self,
@@ -128,48 +155,22 @@ class BotRepo:
         search: Optional[str] = None,
     ) -> PaginatedResponse[Bot]:
         """Get paginated bots by project with filters"""
-
-        if state and search:
-            # Complex filtering
-            bots = await self.bot_dal.get_by_state(state, project_id)
-            if search:
-                bots = [bot for bot in bots if search.lower() in bot.name.lower()]
-            total = len(bots)
-            start = pagination.offset
-            end = start + pagination.limit
-            items = bots[start:end]
-        elif state:
-            bots = await self.bot_dal.get_by_state(state, project_id)
-            total = len(bots)
-            start = pagination.offset
-            end = start + pagination.limit
-            items = bots[start:end]
-        elif search:
-            items = await self.bot_dal.search_by_name(search, project_id)
-            total = len(items)
-            start = pagination.offset
-            end = start + pagination.limit
-            items = items[start:end]
-        else:
-            # Get all by project then paginate
-            all_bots = await self.bot_dal.get_by_project_id(project_id)
-            total = len(all_bots)
-            start = pagination.offset
-            end = start + pagination.limit
-            items = all_bots[start:end]
+        items, total = await self.bot_dal.get_project_page(project_id, skip=pagination.offset, limit=pagination.limit, state=state, search=search)
 
         return PaginatedResponse[Bot](
             items=items,
-            total=total,
-            page=pagination.page,
-            size=pagination.limit,
-            pages=(total + pagination.limit - 1) // pagination.limit,
+            paging=PagingInfo(
+                total=total,
+                total_pages=(total + pagination.limit - 1) // pagination.limit,
+                page=pagination.page,
+                page_size=pagination.limit,
+            ),
         )
 
     # Bot state management
-    async def join_meeting(self, bot_id: str, recording: bool = False) -> Bot:
-        """Make bot join meeting"""
-        bot = await self.get_bot_by_id(bot_id)
+    async def join_meeting(self, bot_id: str, recording: bool = False) -> Tuple[BotState, Bot]:
+        """Make bot join meeting, returning the state it left along with the bot"""
+        bot = await self.get_bot_by_id(bot_id, for_update=True)
 
         if not bot.can_join_meeting():
             raise ValidationException("bots.validation.cannot_join_meeting")
@@ -177,7 +178,7 @@ class BotRepo:
         # Update state
         old_state = bot.state
         bot.start_joining()
-        await self.bot_dal.update(bot)
+        await self.bot_dal.update(bot.id, {"state": bot.state})
 
         # Create event
         await self._create_bot_event(
@@ -187,7 +188,7 @@ class BotRepo:
             event_type=BotEventType.JOIN_REQUESTED,
         )
 
-        return bot
+        return old_state, bot
 
     async def bot_joined_meeting(self, bot_id: str, recording: bool = False) -> Bot:
         """Update bot state when it successfully joins meeting"""
@@ -196,7 +197,14 @@ class BotRepo:
         old_state = bot.state
         bot.join_meeting(recording)
         bot.update_heartbeat()
-        await self.bot_dal.update(bot)
+        await self.bot_dal.update(
+            bot.id,
+            {
+                "state": bot.state,
+                "first_heartbeat_timestamp": bot.first_heartbeat_timestamp,
+                "last_heartbeat_timestamp": bot.last_heartbeat_timestamp,
+            },
+        )
 
         # Create event
         await self._create_bot_event(
@@ -208,16 +216,16 @@ class BotRepo:
 
         return bot
 
-    async def start_recording(self, bot_id: str) -> Bot:
-        """Start bot recording"""
-        bot = await self.get_bot_by_id(bot_id)
+    async def start_recording(self, bot_id: str) -> Tuple[BotState, Bot]:
+        """Start bot recording, returning the state it left along with the bot"""
+        bot = await self.get_bot_by_id(bot_id, for_update=True)
 
         if not bot.is_active():
             raise ValidationException("bots.validation.bot_not_active")
 
         old_state = bot.state
         bot.start_recording()
-        await self.bot_dal.update(bot)
+        await self.bot_dal.update(bot.id, {"state": bot.state})
 
         # Create event
         await self._create_bot_event(
@@ -227,18 +235,18 @@ class BotRepo:
             event_type=BotEventType.BOT_RECORDING_PERMISSION_GRANTED,
         )
 
-        return bot
+        return old_state, bot
 
-    async def leave_meeting(self, bot_id: str) -> Bot:
-        """Make bot leave meeting"""
-        bot = await self.get_bot_by_id(bot_id)
+    async def leave_meeting(self, bot_id: str) -> Tuple[BotState, Bot]:
+        """Make bot leave meeting, returning the state it left along with the bot"""
+        bot = await self.get_bot_by_id(bot_id, for_update=True)
 
         if not bot.can_leave_meeting():
             raise ValidationException("bots.validation.cannot_leave_meeting")
 
         old_state = bot.state
         bot.leave_meeting()
-        await self.bot_dal.update(bot)
+        await self.bot_dal.update(bot.id, {"state": bot.state})
 
         # Create event
         await self._create_bot_event(
@@ -249,13 +257,29 @@ class BotRepo:
             event_sub_type=BotEventSubType.LEAVE_REQUESTED_USER,
         )
 
-        return bot
+        return old_state, bot
 
     async def update_heartbeat(self, bot_id: str) -> Bot:
-        """Update bot heartbeat"""
+        """Update bot heartbeat, coalescing writes that arrive within the write interval"""
         bot = await self.get_bot_by_id(bot_id)
+        if bot_id in _heartbeat_written:
+            return bot
+
         bot.update_heartbeat()
-        return await self.bot_dal.update(bot)
+        bot = await self.bot_dal.update(
+            bot.id,
+            {
+                "first_heartbeat_timestamp": bot.first_heartbeat_timestamp,
+                "last_heartbeat_timestamp": bot.last_heartbeat_timestamp,
+            },
+        )
+        # The session dependency never commits, so commit here and coalesce only once the
+        # write is durable; a failed or rolled-back write is retried on the next heartbeat
+        committed = self.session.commit()
+        if inspect.isawaitable(committed):  # AsyncSession
+            await committed
+        _heartbeat_written[bot_id] = True
+        return bot
 
     async def set_bot_error(self, bot_id: str, error_details: Optional[Dict[str, Any]] = None) -> Bot:
         """Set bot to error state"""
@@ -263,7 +287,7 @@ class BotRepo:
 
         old_state = bot.state
         bot.set_error()
-        await self.bot_dal.update(bot)
+        await self.bot_dal.update(bot.id, {"state": bot.state})
 
         # Create event
         await self._create_bot_event(
@@ -279,8 +303,10 @@ class BotRepo:
     # Bot events
     async def get_bot_events(self, bot_id: str, limit: int = 100) -> List[BotEvent]:
         """Get events for a bot"""
-        await self.get_bot_by_id(bot_id)  # Validate bot exists
-        return await self.event_dal.get_by_bot_id(bot_id, limit)
+        events = await self.event_dal.get_by_bot_id(bot_id, limit)
+        if not events:
+            await self.get_bot_by_id(bot_id)  # Validate bot exists only when it has no events
+        return events
 
     # Utility methods
     async def get_active_bots(self, project_id: Optional[str] = None) -> List[Bot]:
@@ -305,7 +331,7 @@ class BotRepo:
             "is_recording": bot.is_recording(),
             "total_events": event_count,
             "latest_event": latest_event.event_type.value if latest_event else None,
-            "created_at": bot.created_at,
+            "created_at": bot.create_date,
             "last_heartbeat": bot.last_heartbeat_timestamp,
         }
 
@@ -330,17 +356,17 @@ class BotRepo:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> BotEvent:
         """Create a bot event"""
-        event = BotEvent(
-            bot_id=bot_id,
-            old_state=old_state,
-            new_state=new_state,
-            event_type=event_type,
-            event_sub_type=event_sub_type,
-            metadata_=metadata or {},
+        return await self.event_dal.create(
+            {
+                "bot_id": bot_id,
+                "old_state": old_state,
+                "new_state": new_state,
+                "event_type": event_type,
+                "event_sub_type": event_sub_type,
+                "metadata_": metadata or {},
+            }
         )
 
-        return await self.event_dal.create(event)
-
     async def get_all_bots(
         self,
         skip: int = 0,
@@ -387,9 +413,24 @@ class BotRepo:
             pages=pages,
         )
 
+    async def get_all_bots_admin_rows(
+        self,
+        pagination: PaginationParams,
+        state: Optional[str] = None,
+        search: Optional[str] = None,
+        project_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Row], int, Optional[str]]:
+        """Get a page of admin listing rows, the total matching count and the cursor for the next page"""
+        rows = await self.bot_dal.get_admin_rows(pagination.offset, pagination.limit, state, search, project_id, organization_id, cursor=_decode_admin_cursor(cursor) if cursor else None)
+        total = await self.bot_dal.count_admin(state, search, project_id, organization_id)
+        next_cursor = _encode_admin_cursor(rows[-1].created_at, rows[-1].id) if len(rows) == pagination.limit else None
+        return rows, total, next_cursor
+
     async def get_bot_stats_admin(self) -> Dict[str, Any]:
         """Get bot statistics for admin dashboard"""
-        total_count = await self.bot_dal.count_all_bots()
+        total_count = await self.bot_dal.count_all_bots(precise=False)
         ready_count = await self.bot_dal.count_by_state_all(BotState.READY)
         joined_count = await self.bot_dal.count_by_state_all(BotState.JOINED_NOT_RECORDING) + await self.bot_dal.count_by_state_all(BotState.JOINED_RECORDING)
         error_count = await self.bot_dal.count_by_state_all(BotState.FATAL_ERROR)
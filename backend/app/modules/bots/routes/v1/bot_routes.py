@@ -1,10 +1,12 @@
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, Query, status
-from sqlmodel import Session
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.base_model import PaginationParams
-from app.core.database import get_session
+from app.core.database import get_async_session
 from app.exceptions.handlers import handle_exceptions
 from app.modules.bots.repository.bot_repo import BotRepo
 from app.modules.bots.schemas.bot_request import (
@@ -13,12 +15,14 @@ from app.modules.bots.schemas.bot_request import (
     UpdateBotRequest,
 )
 from app.modules.bots.schemas.bot_response import (
+    BOT_EVENT_RESPONSE_JSON,
+    BOT_RESPONSE_JSON,
     BotActionAPIResponse,
     BotActionResponse,
     BotAPIResponse,
     BotEventListAPIResponse,
     BotEventResponse,
-    BotListResponse,
+    BotListItem,
     BotPaginatedAPIResponse,
     BotResponse,
     BotStatsAPIResponse,
@@ -29,19 +33,24 @@ from app.utils.security import get_current_user
 
 router = APIRouter(tags=["Bots"])
 
+# Constant envelope around the project bot listing, encoded once at import
+_PROJECT_PAGE_HEAD = orjson.dumps({"error_code": 0, "message": "bots.messages.retrieved_successfully"})[:-1] + b',"data":{"items":'
+_PROJECT_PAGE_MID = b',"paging":'
+_PROJECT_PAGE_TAIL = b"}}"
+
 
 @router.post(
     "/",
-    response_model=BotAPIResponse,
+    responses={201: {"model": BotAPIResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Create bot",
 )
 @handle_exceptions
 async def create_bot(
     request: CreateBotRequest,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> BotAPIResponse:
+) -> ORJSONResponse:
     """Create a new bot"""
     repo = BotRepo(session)
 
@@ -55,24 +64,24 @@ async def create_bot(
     )
 
     response_data = BotResponse.from_entity(bot)
-    return BotAPIResponse.success(data=response_data, message="bots.messages.created_successfully")
+    return ORJSONResponse(BotAPIResponse.success(data=response_data, message="bots.messages.created_successfully").model_dump(), status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/project/{project_id}",
-    response_model=BotPaginatedAPIResponse,
+    responses={200: {"model": BotPaginatedAPIResponse}},
     summary="Get bots by project",
 )
 @handle_exceptions
 async def get_bots_by_project(
     project_id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
     state: str = Query(None),
     search: str = Query(None),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-) -> BotPaginatedAPIResponse:
+) -> Response:
     """Get paginated list of bots by project"""
     repo = BotRepo(session)
 
@@ -80,38 +89,44 @@ async def get_bots_by_project(
 
     bots_page = await repo.get_bots_by_project(project_id=project_id, pagination=pagination, state=state, search=search)
 
-    # Convert entities to response schemas
-    response_items = [BotListResponse.from_entity(bot) for bot in bots_page.items]
-
-    bots_page.items = response_items
-
-    return BotPaginatedAPIResponse.success(data=bots_page, message="bots.messages.retrieved_successfully")
+    # Only the items and paging are encoded per request; the envelope bytes are prebuilt
+    paging = bots_page.paging
+    body = b"".join(
+        (
+            _PROJECT_PAGE_HEAD,
+            orjson.dumps(BotListItem.from_entities(bots_page.items)),
+            _PROJECT_PAGE_MID,
+            b'{"total":%d,"total_pages":%d,"page":%d,"page_size":%d}' % (paging.total, paging.total_pages, paging.page, paging.page_size),
+            _PROJECT_PAGE_TAIL,
+        )
+    )
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/{bot_id}", response_model=BotAPIResponse, summary="Get bot by ID")
+@router.get("/{bot_id}", responses={200: {"model": BotAPIResponse}}, summary="Get bot by ID")
 @handle_exceptions
 async def get_bot(
     bot_id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> BotAPIResponse:
+) -> ORJSONResponse:
     """Get bot by ID"""
     repo = BotRepo(session)
 
     bot = await repo.get_bot_by_id(bot_id)
     response_data = BotResponse.from_entity(bot)
 
-    return BotAPIResponse.success(data=response_data, message="bots.messages.retrieved_successfully")
+    return ORJSONResponse({"error_code": 0, "message": "bots.messages.retrieved_successfully", "data": orjson.Fragment(BOT_RESPONSE_JSON(response_data))})
 
 
-@router.patch("/{bot_id}", response_model=BotAPIResponse, summary="Update bot")
+@router.patch("/{bot_id}", responses={200: {"model": BotAPIResponse}}, summary="Update bot")
 @handle_exceptions
 async def update_bot(
     bot_id: str,
     request: UpdateBotRequest,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> BotAPIResponse:
+) -> ORJSONResponse:
     """Update bot"""
     repo = BotRepo(session)
 
@@ -125,14 +140,14 @@ async def update_bot(
     )
 
     response_data = BotResponse.from_entity(bot)
-    return BotAPIResponse.success(data=response_data, message="bots.messages.updated_successfully")
+    return ORJSONResponse(BotAPIResponse.success(data=response_data, message="bots.messages.updated_successfully").model_dump())
 
 
 @router.delete("/{bot_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete bot")
 @handle_exceptions
 async def delete_bot(
     bot_id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> None:
     """Delete bot (soft delete)"""
@@ -143,109 +158,105 @@ async def delete_bot(
 # Bot Actions
 
 
-@router.post("/{bot_id}/join", response_model=BotActionAPIResponse, summary="Join meeting")
+@router.post("/{bot_id}/join", responses={200: {"model": BotActionAPIResponse}}, summary="Join meeting")
 @handle_exceptions
 async def join_meeting(
     bot_id: str,
     request: JoinMeetingRequest,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> BotActionAPIResponse:
+) -> ORJSONResponse:
     """Make bot join meeting"""
     repo = BotRepo(session)
 
-    old_bot = await repo.get_bot_by_id(bot_id)
-    old_state = old_bot.state
-
-    bot = await repo.join_meeting(bot_id, request.recording)
+    old_state, bot = await repo.join_meeting(bot_id, request.recording)
 
     response_data = BotActionResponse.success_action(bot, "join_meeting", old_state)
-    return BotActionAPIResponse.success(data=response_data, message="bots.messages.join_requested_successfully")
+    return ORJSONResponse(BotActionAPIResponse.success(data=response_data, message="bots.messages.join_requested_successfully").model_dump())
 
 
-@router.post("/{bot_id}/leave", response_model=BotActionAPIResponse, summary="Leave meeting")
+@router.post("/{bot_id}/leave", responses={200: {"model": BotActionAPIResponse}}, summary="Leave meeting")
 @handle_exceptions
 async def leave_meeting(
     bot_id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> BotActionAPIResponse:
+) -> ORJSONResponse:
     """Make bot leave meeting"""
     repo = BotRepo(session)
 
-    old_bot = await repo.get_bot_by_id(bot_id)
-    old_state = old_bot.state
-
-    bot = await repo.leave_meeting(bot_id)
+    old_state, bot = await repo.leave_meeting(bot_id)
 
     response_data = BotActionResponse.success_action(bot, "leave_meeting", old_state)
-    return BotActionAPIResponse.success(data=response_data, message="bots.messages.leave_requested_successfully")
+    return ORJSONResponse(BotActionAPIResponse.success(data=response_data, message="bots.messages.leave_requested_successfully").model_dump())
 
 
 @router.post(
     "/{bot_id}/start-recording",
-    response_model=BotActionAPIResponse,
+    responses={200: {"model": BotActionAPIResponse}},
     summary="Start recording",
 )
 @handle_exceptions
 async def start_recording(
     bot_id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> BotActionAPIResponse:
+) -> ORJSONResponse:
     """Start bot recording"""
     repo = BotRepo(session)
 
-    old_bot = await repo.get_bot_by_id(bot_id)
-    old_state = old_bot.state
-
-    bot = await repo.start_recording(bot_id)
+    old_state, bot = await repo.start_recording(bot_id)
 
     response_data = BotActionResponse.success_action(bot, "start_recording", old_state)
-    return BotActionAPIResponse.success(data=response_data, message="bots.messages.recording_started_successfully")
+    return ORJSONResponse(BotActionAPIResponse.success(data=response_data, message="bots.messages.recording_started_successfully").model_dump())
 
 
-@router.post("/{bot_id}/heartbeat", response_model=BotAPIResponse, summary="Update heartbeat")
+@router.post("/{bot_id}/heartbeat", responses={200: {"model": BotAPIResponse}}, summary="Update heartbeat")
 @handle_exceptions
-async def update_heartbeat(bot_id: str, session: Annotated[Session, Depends(get_session)]) -> BotAPIResponse:
+async def update_heartbeat(bot_id: str, session: Annotated[AsyncSession, Depends(get_async_session)]) -> ORJSONResponse:
     """Update bot heartbeat - no auth required for bot heartbeat"""
     repo = BotRepo(session)
 
     bot = await repo.update_heartbeat(bot_id)
     response_data = BotResponse.from_entity(bot)
 
-    return BotAPIResponse.success(data=response_data, message="bots.messages.heartbeat_updated_successfully")
+    return ORJSONResponse({"error_code": 0, "message": "bots.messages.heartbeat_updated_successfully", "data": orjson.Fragment(BOT_RESPONSE_JSON(response_data))})
 
 
-@router.get("/{bot_id}/stats", response_model=BotStatsAPIResponse, summary="Get bot statistics")
+@router.get("/{bot_id}/stats", responses={200: {"model": BotStatsAPIResponse}}, summary="Get bot statistics")
 @handle_exceptions
 async def get_bot_stats(
     bot_id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> BotStatsAPIResponse:
+) -> ORJSONResponse:
     """Get bot statistics"""
     repo = BotRepo(session)
 
     stats = await repo.get_bot_stats(bot_id)
     response_data = BotStatsResponse(**stats)
 
-    return BotStatsAPIResponse.success(data=response_data, message="bots.messages.stats_retrieved_successfully")
+    return ORJSONResponse(BotStatsAPIResponse.success(data=response_data, message="bots.messages.stats_retrieved_successfully").model_dump())
 
 
-@router.get("/{bot_id}/events", response_model=BotEventListAPIResponse, summary="Get bot events")
+@router.get("/{bot_id}/events", responses={200: {"model": BotEventListAPIResponse}}, summary="Get bot events")
 @handle_exceptions
 async def get_bot_events(
     bot_id: str,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[User, Depends(get_current_user)],
     limit: int = Query(100, ge=1, le=500),
-) -> BotEventListAPIResponse:
+) -> ORJSONResponse:
     """Get bot events"""
     repo = BotRepo(session)
 
     events = await repo.get_bot_events(bot_id, limit)
 
-    response_items = [BotEventResponse.from_entity(event) for event in events]
-
-    return BotEventListAPIResponse.success(data=response_items, message="bots.messages.events_retrieved_successfully")
+    # Build the envelope directly so it is not re-validated against the response model
+    return ORJSONResponse(
+        {
+            "error_code": 0,
+            "message": "bots.messages.events_retrieved_successfully",
+            "data": [orjson.Fragment(BOT_EVENT_RESPONSE_JSON(BotEventResponse.from_entity(event))) for event in events],
+        }
+    )
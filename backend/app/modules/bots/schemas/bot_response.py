@@ -1,8 +1,9 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from app.core.base_model import APIResponse, PaginatedResponse, ResponseSchema
-from app.modules.bots.models.bot_model import BotEventSubType, BotEventType, BotState
+from app.modules.bots.models.bot_model import ACTIVE_BOT_STATES, BotEventSubType, BotEventType, BotState
 
 
 class BotResponse(ResponseSchema):
@@ -33,27 +34,28 @@ class BotResponse(ResponseSchema):
 
     @classmethod
     def from_entity(cls, bot) -> "BotResponse":
-        """Convert Bot entity to response schema"""
-        return cls(
+        """Convert Bot entity to response schema (trusted ORM data, so validation is skipped)"""
+        is_active, is_recording, can_join, can_leave, display_name = bot._compute_flags()
+        return cls.model_construct(
             id=str(bot.id),
             name=bot.name,
             meeting_url=bot.meeting_url,
             meeting_uuid=bot.meeting_uuid,
             state=bot.state,
-            project_id=bot.project_id,
+            project_id=str(bot.project_id),
             object_id=bot.object_id,
             settings=bot.settings,
             metadata_=bot.metadata_,
             first_heartbeat_timestamp=bot.first_heartbeat_timestamp,
             last_heartbeat_timestamp=bot.last_heartbeat_timestamp,
             join_at=bot.join_at,
-            created_at=bot.created_at,
-            updated_at=bot.updated_at,
-            display_name=bot.get_display_name(),
-            is_active=bot.is_active(),
-            is_recording=bot.is_recording(),
-            can_join_meeting=bot.can_join_meeting(),
-            can_leave_meeting=bot.can_leave_meeting(),
+            created_at=bot.create_date,
+            updated_at=bot.update_date,
+            display_name=display_name,
+            is_active=is_active,
+            is_recording=is_recording,
+            can_join_meeting=can_join,
+            can_leave_meeting=can_leave,
             meeting_domain=bot.get_meeting_domain(),
         )
 
@@ -72,22 +74,6 @@ class BotListResponse(ResponseSchema):
     created_at: datetime
     last_heartbeat_timestamp: Optional[int]
 
-    @classmethod
-    def from_entity(cls, bot) -> "BotListResponse":
-        """Convert Bot entity to list response schema"""
-        return cls(
-            id=str(bot.id),
-            name=bot.name,
-            meeting_url=bot.meeting_url,
-            state=bot.state,
-            project_id=bot.project_id,
-            object_id=bot.object_id,
-            is_active=bot.is_active(),
-            is_recording=bot.is_recording(),
-            created_at=bot.created_at,
-            last_heartbeat_timestamp=bot.last_heartbeat_timestamp,
-        )
-
 
 class BotEventResponse(ResponseSchema):
     """Bot event response schema"""
@@ -110,8 +96,8 @@ class BotEventResponse(ResponseSchema):
 
     @classmethod
     def from_entity(cls, event) -> "BotEventResponse":
-        """Convert BotEvent entity to response schema"""
-        return cls(
+        """Convert BotEvent entity to response schema (trusted ORM data, so validation is skipped)"""
+        return cls.model_construct(
             id=str(event.id),
             old_state=event.old_state,
             new_state=event.new_state,
@@ -119,9 +105,9 @@ class BotEventResponse(ResponseSchema):
             event_sub_type=event.event_sub_type,
             metadata_=event.metadata_,
             requested_bot_action_taken_at=event.requested_bot_action_taken_at,
-            bot_id=event.bot_id,
+            bot_id=str(event.bot_id),
             object_id=event.object_id,
-            created_at=event.created_at,
+            created_at=event.create_date,
             is_error_event=event.is_error_event(),
             is_state_change=event.is_state_change(),
             event_description=event.get_event_description(),
@@ -155,16 +141,74 @@ class BotActionResponse(ResponseSchema):
     @classmethod
     def success_action(cls, bot, action: str, old_state: Optional[BotState] = None) -> "BotActionResponse":
         """Create successful action response"""
-        return cls(
+        # _value_ is the plain instance attribute behind the .value descriptor
+        return cls.model_construct(
             bot_id=str(bot.id),
             action=action,
-            old_state=old_state.value if old_state else None,
-            new_state=bot.state.value,
+            old_state=old_state._value_ if old_state else None,
+            new_state=bot.state._value_,
             success=True,
             message=f"Bot {action} successful",
         )
 
 
+@dataclass(slots=True)
+class AdminBotRow:
+    """Admin bot list row, field order matches the DAL's admin list columns"""
+
+    id: str
+    name: str
+    meeting_url: str
+    project_id: str
+    state: BotState
+    meeting_uuid: Optional[str]
+    join_at: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True)
+class BotListItem:
+    """Bot list item encoded natively by orjson; mirrors BotListResponse, which stays the documented schema"""
+
+    id: str
+    name: str
+    meeting_url: str
+    state: BotState
+    project_id: str
+    object_id: str
+    is_active: bool
+    is_recording: bool
+    created_at: datetime
+    last_heartbeat_timestamp: Optional[int]
+
+    @classmethod
+    def from_entities(cls, bots) -> List["BotListItem"]:
+        """Convert a page of Bot entities in one comprehension; the only Bot-to-list-item converter"""
+        active_states, recording = ACTIVE_BOT_STATES, BotState.JOINED_RECORDING
+        return [
+            cls(
+                str(bot.id),
+                bot.name,
+                bot.meeting_url,
+                bot.state,
+                str(bot.project_id),
+                bot.object_id,
+                bot.state in active_states and not bot.is_deleted,
+                bot.state == recording,
+                bot.create_date,
+                bot.last_heartbeat_timestamp,
+            )
+            for bot in bots
+        ]
+
+
+# Bound pydantic-core serializers: hot routes call these directly and embed the
+# bytes with orjson.Fragment instead of going through model_dump()
+BOT_RESPONSE_JSON = BotResponse.__pydantic_serializer__.to_json
+BOT_EVENT_RESPONSE_JSON = BotEventResponse.__pydantic_serializer__.to_json
+
+
 # API Response types
 BotAPIResponse = APIResponse[BotResponse]
 BotListAPIResponse = APIResponse[List[BotListResponse]]
@@ -1,12 +1,10 @@
-import random
-import string
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy.dialects.mysql import JSON
 from sqlmodel import Field, Relationship
 
 from app.core.base_enums import BaseEnum
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
 
 
 class OrganizationStatus(BaseEnum):
@@ -32,7 +30,7 @@ class Organization(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "org_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("org_"),
         unique=True,
         max_length=32,
         index=True,
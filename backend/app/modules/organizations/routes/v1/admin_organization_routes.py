@@ -1,7 +1,7 @@
 import asyncio
 
 from fastapi import APIRouter, Depends, Form, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlmodel import Session
 
 from app.core.database import get_session
@@ -64,7 +64,7 @@ async def get_current_admin_user():
     return {"username": "admin", "email": "admin@attendee.dev", "is_admin": True}
 
 
-router = APIRouter(prefix="/admin/organizations", tags=["Admin - Organizations"])
+router = APIRouter(prefix="/admin/organizations", tags=["Admin - Organizations"], default_response_class=ORJSONResponse)
 
 
 @router.get("/", summary="Admin - Get all organizations with advanced filtering")
@@ -122,14 +122,14 @@ async def admin_get_organizations(
         print("🎉 SUCCESS: Returning admin organizations list")
         print("===============================================")
 
-        return JSONResponse(content=response_data, status_code=200)
+        return ORJSONResponse(content=response_data, status_code=200)
 
     except Exception as e:
         print(f"❌ ADMIN GET ORGANIZATIONS ERROR: {type(e).__name__}: {str(e)}")
         import traceback
 
         traceback.print_exc()
-        return JSONResponse(content={"error": f"Failed to get organizations: {str(e)}"}, status_code=500)
+        return ORJSONResponse(content={"error": f"Failed to get organizations: {str(e)}"}, status_code=500)
 
 
 @router.get("/stats", summary="Admin - Get organization statistics")
@@ -152,11 +152,11 @@ async def admin_get_organization_stats(
         print(f"   - Total organizations: {stats.get('total_count', 0)}")
         print(f"   - Active organizations: {stats.get('active_count', 0)}")
 
-        return JSONResponse(content={"success": True, "data": stats}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": stats}, status_code=200)
 
     except Exception as e:
         print(f"❌ GET ORGANIZATION STATS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to get organization stats: {str(e)}",
@@ -184,11 +184,11 @@ async def admin_get_low_credit_organizations(
         organizations = await repo.get_low_credit_organizations(threshold)
 
         print(f"✅ Found {len(organizations.items)} organizations with low credits")
-        return JSONResponse(content={"success": True, "data": organizations}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": organizations}, status_code=200)
 
     except Exception as e:
         print(f"❌ GET LOW CREDIT ORGS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to get low credit organizations: {str(e)}",
@@ -217,7 +217,7 @@ async def admin_get_organization_details(
 
         if not organization:
             print(f"❌ ORGANIZATION NOT FOUND: {organization_id}")
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"success": False, "message": "Organization not found"},
                 status_code=404,
             )
@@ -234,11 +234,11 @@ async def admin_get_organization_details(
         }
 
         print(f"✅ Organization details retrieved: {organization.name}")
-        return JSONResponse(content={"success": True, "data": org_data}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": org_data}, status_code=200)
 
     except Exception as e:
         print(f"❌ GET ORGANIZATION DETAILS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to get organization: {str(e)}",
@@ -280,7 +280,7 @@ async def admin_manage_organization_credits(
         )
 
         print(f"✅ Credits updated: {old_credits} -> {organization.centicredits}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": f"Credits {operation}ed successfully",
@@ -297,7 +297,7 @@ async def admin_manage_organization_credits(
 
     except Exception as e:
         print(f"❌ MANAGE CREDITS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to manage credits: {str(e)}",
@@ -325,7 +325,7 @@ async def admin_suspend_organization(
         organization = await repo.suspend_organization(organization_id)
 
         print(f"✅ Organization suspended: {organization.name}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": f"Organization {organization.name} suspended successfully",
@@ -335,7 +335,7 @@ async def admin_suspend_organization(
 
     except Exception as e:
         print(f"❌ SUSPEND ORGANIZATION ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to suspend organization: {str(e)}",
@@ -363,7 +363,7 @@ async def admin_activate_organization(
         organization = await repo.activate_organization(organization_id)
 
         print(f"✅ Organization activated: {organization.name}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": f"Organization {organization.name} activated successfully",
@@ -373,7 +373,7 @@ async def admin_activate_organization(
 
     except Exception as e:
         print(f"❌ ACTIVATE ORGANIZATION ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to activate organization: {str(e)}",
@@ -401,14 +401,14 @@ async def admin_delete_organization(
         await repo.delete_organization(organization_id)
 
         print(f"✅ Organization deleted: {organization_id}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": True, "message": "Organization deleted successfully"},
             status_code=200,
         )
 
     except Exception as e:
         print(f"❌ DELETE ORGANIZATION ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to delete organization: {str(e)}",
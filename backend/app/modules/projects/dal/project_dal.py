@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import update as sa_update
 from sqlmodel import func, select
 
 from app.core.base_dal import BaseDAL
@@ -15,7 +17,7 @@ class ProjectDAL(BaseDAL[Project]):
     """Project Data Access Layer"""
 
     def __init__(self):
-        super().__init__(Project)
+        super().__init__(None, Project)
 
     async def get_by_object_id(self, object_id: str) -> Optional[Project]:
         """Get project by object_id"""
@@ -24,7 +26,7 @@ class ProjectDAL(BaseDAL[Project]):
 
     async def get_by_organization_id(self, organization_id: str) -> List[Project]:
         """Get projects by organization ID"""
-        query = select(self.model).where(self.model.organization_id == organization_id, ~self.model.is_deleted).order_by(self.model.created_at.desc())
+        query = select(self.model).where(self.model.organization_id == organization_id, ~self.model.is_deleted).order_by(self.model.create_date.desc())
         return await self._get_all(query)
 
     async def get_by_organization_and_name(self, organization_id: str, name: str) -> Optional[Project]:
@@ -52,7 +54,7 @@ class ProjectDAL(BaseDAL[Project]):
         if organization_id:
             query = query.where(self.model.organization_id == organization_id)
 
-        return await self._get_all(query.order_by(self.model.created_at.desc()))
+        return await self._get_all(query.order_by(self.model.create_date.desc()))
 
     async def count_by_organization(self, organization_id: str) -> int:
         """Count projects by organization"""
@@ -66,7 +68,7 @@ class ProjectDAL(BaseDAL[Project]):
 
     async def get_all_projects(self, skip: int = 0, limit: int = 20) -> List[Project]:
         """Get all projects with pagination"""
-        query = select(self.model).where(~self.model.is_deleted).order_by(self.model.created_at.desc()).offset(skip).limit(limit)
+        query = select(self.model).where(~self.model.is_deleted).order_by(self.model.create_date.desc()).offset(skip).limit(limit)
         return await self._get_all(query)
 
     async def count_all_projects(self) -> int:
@@ -86,7 +88,7 @@ class ApiKeyDAL(BaseDAL[ApiKey]):
     """API Key Data Access Layer"""
 
     def __init__(self):
-        super().__init__(ApiKey)
+        super().__init__(None, ApiKey)
 
     async def get_by_object_id(self, object_id: str) -> Optional[ApiKey]:
         """Get API key by object_id"""
@@ -100,7 +102,7 @@ class ApiKeyDAL(BaseDAL[ApiKey]):
 
     async def get_by_project_id(self, project_id: str) -> List[ApiKey]:
         """Get API keys by project ID"""
-        query = select(self.model).where(self.model.project_id == project_id, ~self.model.is_deleted).order_by(self.model.created_at.desc())
+        query = select(self.model).where(self.model.project_id == project_id, ~self.model.is_deleted).order_by(self.model.create_date.desc())
         return await self._get_all(query)
 
     async def get_active_keys_by_project(self, project_id: str) -> List[ApiKey]:
@@ -112,13 +114,13 @@ class ApiKeyDAL(BaseDAL[ApiKey]):
                 self.model.status == ApiKeyStatus.ACTIVE,
                 ~self.model.is_deleted,
             )
-            .order_by(self.model.created_at.desc())
+            .order_by(self.model.create_date.desc())
         )
         return await self._get_all(query)
 
     async def get_by_status(self, status: ApiKeyStatus) -> List[ApiKey]:
         """Get API keys by status"""
-        query = select(self.model).where(self.model.status == status, ~self.model.is_deleted).order_by(self.model.created_at.desc())
+        query = select(self.model).where(self.model.status == status, ~self.model.is_deleted).order_by(self.model.create_date.desc())
         return await self._get_all(query)
 
     async def count_by_project(self, project_id: str) -> int:
@@ -151,11 +153,20 @@ class ApiKeyDAL(BaseDAL[ApiKey]):
         try:
             await self._begin_transaction()
 
-            api_keys = await self.get_by_project_id(project_id)
-            for api_key in api_keys:
-                if api_key.status == ApiKeyStatus.ACTIVE:
-                    api_key.disable()
-                    await self.update(api_key)
+            # Single UPDATE instead of loading and updating each key; a Core UPDATE
+            # bypasses the per-instance update_date bump, so it is set here
+            now = datetime.utcnow()
+            stmt = (
+                sa_update(self.model)
+                .where(
+                    self.model.project_id == project_id,
+                    self.model.status == ApiKeyStatus.ACTIVE,
+                    self.model.is_deleted == False,
+                )
+                .values(status=ApiKeyStatus.DISABLED, disabled_at=now.isoformat(), update_date=now)
+                .execution_options(synchronize_session="evaluate")
+            )
+            await self._execute_query(stmt)
 
             await self._commit_transaction()
             return True
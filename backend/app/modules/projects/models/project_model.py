@@ -1,13 +1,12 @@
-import random
-import string
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlalchemy.dialects.mysql import JSON
 from sqlmodel import Field, Relationship
 
 from app.core.base_enums import BaseEnum
-from app.core.base_model import BaseEntity
+from app.core.base_model import BaseEntity, generate_object_id
 
 
 class ProjectStatus(BaseEnum):
@@ -18,6 +17,10 @@ class ProjectStatus(BaseEnum):
 
 class Project(BaseEntity, table=True):
     __tablename__ = "project"
+    __table_args__ = (
+        Index("ix_project_org_deleted_created", "organization_id", "is_deleted", "create_date"),
+        Index("ix_project_status_deleted_created", "status", "is_deleted", "create_date"),
+    )
 
     # Core fields
     name: str = Field(index=True, max_length=255)
@@ -26,7 +29,7 @@ class Project(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "proj_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("proj_"),
         unique=True,
         max_length=32,
         index=True,
@@ -166,6 +169,10 @@ class ApiKeyStatus(BaseEnum):
 
 class ApiKey(BaseEntity, table=True):
     __tablename__ = "apikey"
+    __table_args__ = (
+        Index("ix_apikey_project_deleted_created", "project_id", "is_deleted", "create_date"),
+        Index("ix_apikey_project_status_created", "project_id", "status", "is_deleted", "create_date"),
+    )
 
     # Core fields
     name: str = Field(max_length=255)
@@ -175,7 +182,7 @@ class ApiKey(BaseEntity, table=True):
 
     # Auto-generated object_id
     object_id: str = Field(
-        default_factory=lambda: "key_" + "".join(random.choices(string.ascii_letters + string.digits, k=16)),
+        default_factory=lambda: generate_object_id("key_"),
         unique=True,
         max_length=32,
         index=True,
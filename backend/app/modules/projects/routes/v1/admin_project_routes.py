@@ -1,7 +1,7 @@
 import asyncio
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlmodel import Session
 
 from app.core.database import get_session
@@ -64,7 +64,7 @@ async def get_current_admin_user():
     return {"username": "admin", "email": "admin@attendee.dev", "is_admin": True}
 
 
-router = APIRouter(prefix="/admin/projects", tags=["Admin - Projects"])
+router = APIRouter(prefix="/admin/projects", tags=["Admin - Projects"], default_response_class=ORJSONResponse)
 
 
 @router.get("/", summary="Admin - Get all projects with advanced filtering")
@@ -140,14 +140,14 @@ async def admin_get_projects(
         print("🎉 SUCCESS: Returning admin projects list")
         print("==========================================")
 
-        return JSONResponse(content=response_data, status_code=200)
+        return ORJSONResponse(content=response_data, status_code=200)
 
     except Exception as e:
         print(f"❌ ADMIN GET PROJECTS ERROR: {type(e).__name__}: {str(e)}")
         import traceback
 
         traceback.print_exc()
-        return JSONResponse(content={"error": f"Failed to get projects: {str(e)}"}, status_code=500)
+        return ORJSONResponse(content={"error": f"Failed to get projects: {str(e)}"}, status_code=500)
 
 
 @router.get("/stats", summary="Admin - Get project statistics")
@@ -171,11 +171,11 @@ async def admin_get_project_stats(
         print(f"   - Active projects: {stats.get('active_count', 0)}")
         print(f"   - Archived projects: {stats.get('archived_count', 0)}")
 
-        return JSONResponse(content={"success": True, "data": stats}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": stats}, status_code=200)
 
     except Exception as e:
         print(f"❌ GET PROJECT STATS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to get project stats: {str(e)}",
@@ -204,7 +204,7 @@ async def admin_get_project_details(
 
         if not project:
             print(f"❌ PROJECT NOT FOUND: {project_id}")
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"success": False, "message": "Project not found"},
                 status_code=404,
             )
@@ -221,11 +221,11 @@ async def admin_get_project_details(
         }
 
         print(f"✅ Project details retrieved: {project.name}")
-        return JSONResponse(content={"success": True, "data": project_data}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": project_data}, status_code=200)
 
     except Exception as e:
         print(f"❌ GET PROJECT DETAILS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": False, "message": f"Failed to get project: {str(e)}"},
             status_code=500,
         )
@@ -250,11 +250,11 @@ async def admin_get_project_individual_stats(
         stats = await repo.get_project_stats(project_id)
 
         print("✅ Project individual stats retrieved")
-        return JSONResponse(content={"success": True, "data": stats}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": stats}, status_code=200)
 
     except Exception as e:
         print(f"❌ GET PROJECT INDIVIDUAL STATS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to get project stats: {str(e)}",
@@ -282,7 +282,7 @@ async def admin_archive_project(
         project = await repo.archive_project(project_id)
 
         print(f"✅ Project archived: {project.name}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": f"Project {project.name} archived successfully",
@@ -292,7 +292,7 @@ async def admin_archive_project(
 
     except Exception as e:
         print(f"❌ ARCHIVE PROJECT ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to archive project: {str(e)}",
@@ -320,7 +320,7 @@ async def admin_activate_project(
         project = await repo.activate_project(project_id)
 
         print(f"✅ Project activated: {project.name}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": f"Project {project.name} activated successfully",
@@ -330,7 +330,7 @@ async def admin_activate_project(
 
     except Exception as e:
         print(f"❌ ACTIVATE PROJECT ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to activate project: {str(e)}",
@@ -358,14 +358,14 @@ async def admin_delete_project(
         await repo.delete_project(project_id)
 
         print(f"✅ Project deleted: {project_id}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": True, "message": "Project deleted successfully"},
             status_code=200,
         )
 
     except Exception as e:
         print(f"❌ DELETE PROJECT ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to delete project: {str(e)}",
@@ -393,7 +393,7 @@ async def admin_get_project_api_keys(
         api_keys = await repo.get_project_api_keys(project_id)
 
         print(f"✅ Found {len(api_keys)} API keys for project")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "data": {"api_keys": api_keys, "total": len(api_keys)},
@@ -403,7 +403,7 @@ async def admin_get_project_api_keys(
 
     except Exception as e:
         print(f"❌ GET PROJECT API KEYS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to get project API keys: {str(e)}",
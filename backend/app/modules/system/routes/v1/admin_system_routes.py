@@ -1,10 +1,10 @@
 import asyncio
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlmodel import Session
 
-from app.core.database import get_session
+from app.core.database import get_pool_status, get_session
 from app.exceptions.handlers import handle_exceptions
 from app.modules.bots.repository.bot_repo import BotRepo
 from app.modules.organizations.repository.organization_repo import OrganizationRepo
@@ -67,7 +67,7 @@ async def get_current_admin_user():
     return {"username": "admin", "email": "admin@attendee.dev", "is_admin": True}
 
 
-router = APIRouter(prefix="/admin", tags=["Admin - System"])
+router = APIRouter(prefix="/admin", tags=["Admin - System"], default_response_class=ORJSONResponse)
 
 
 @router.get("/dashboard", summary="Admin - Get dashboard statistics")
@@ -136,14 +136,14 @@ async def admin_dashboard(
         print("🎉 SUCCESS: Returning dashboard data")
         print("===================================")
 
-        return JSONResponse(content={"success": True, "data": dashboard_stats}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": dashboard_stats}, status_code=200)
 
     except Exception as e:
         print(f"❌ DASHBOARD ERROR: {type(e).__name__}: {str(e)}")
         import traceback
 
         traceback.print_exc()
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to get dashboard stats: {str(e)}",
@@ -192,11 +192,11 @@ async def admin_get_settings(
         }
 
         print("✅ System settings retrieved")
-        return JSONResponse(content={"success": True, "data": settings}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": settings}, status_code=200)
 
     except Exception as e:
         print(f"❌ GET SETTINGS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": False, "message": f"Failed to get settings: {str(e)}"},
             status_code=500,
         )
@@ -252,11 +252,11 @@ async def admin_get_webhooks(
         }
 
         print(f"✅ Webhook deliveries retrieved: {len(mock_webhooks)}")
-        return JSONResponse(content=response_data, status_code=200)
+        return ORJSONResponse(content=response_data, status_code=200)
 
     except Exception as e:
         print(f"❌ GET WEBHOOKS ERROR: {str(e)}")
-        return JSONResponse(content={"error": f"Failed to get webhooks: {str(e)}"}, status_code=500)
+        return ORJSONResponse(content={"error": f"Failed to get webhooks: {str(e)}"}, status_code=500)
 
 
 @router.get("/transcriptions", summary="Admin - Get transcription information")
@@ -309,11 +309,11 @@ async def admin_get_transcriptions(
         }
 
         print(f"✅ Transcriptions retrieved: {len(mock_transcriptions)}")
-        return JSONResponse(content=response_data, status_code=200)
+        return ORJSONResponse(content=response_data, status_code=200)
 
     except Exception as e:
         print(f"❌ GET TRANSCRIPTIONS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Failed to get transcriptions: {str(e)}"},
             status_code=500,
         )
@@ -331,13 +331,16 @@ async def admin_system_health(
     print("============================")
 
     try:
-        # Mock health check data
+        pool_status = get_pool_status()
+
+        # Mock health check data (database connection figures come from the live pools)
         health_data = {
             "database": {
                 "status": "healthy",
                 "response_time_ms": 25,
-                "connections": 5,
-                "max_connections": 100,
+                "connections": sum(pool["checked_out"] for pool in pool_status.values()),
+                "max_connections": sum(pool["max_connections"] for pool in pool_status.values()),
+                "pools": pool_status,
             },
             "redis": {
                 "status": "healthy",
@@ -359,11 +362,11 @@ async def admin_system_health(
         }
 
         print("✅ System health check completed")
-        return JSONResponse(content={"success": True, "data": health_data}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": health_data}, status_code=200)
 
     except Exception as e:
         print(f"❌ HEALTH CHECK ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": False, "message": f"Health check failed: {str(e)}"},
             status_code=500,
         )
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, case, func, or_, select
 
 from app.core.base_dal import BaseDAL
 from app.modules.users.models.user_model import User, UserRole, UserStatus
@@ -50,6 +50,34 @@ class UserDAL(BaseDAL[User]):
             await self.db.rollback()
             raise e
 
+    async def find_conflict(self, email: str, username: str) -> Optional[str]:
+        """Return 'email' or 'username' if either is already taken, else None"""
+        try:
+            result = await self.db.execute(
+                select(
+                    case(
+                        (self.model.email == email, "email"),
+                        else_="username",
+                    )
+                )
+                .filter(
+                    and_(
+                        or_(
+                            self.model.email == email,
+                            self.model.username == username,
+                        ),
+                        self.model.is_deleted == False,
+                    )
+                )
+                # Two rows can match (one per field); report the email conflict first
+                .order_by(case((self.model.email == email, 0), else_=1))
+                .limit(1)
+            )
+            return result.scalar_one_or_none()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
     async def get_by_organization_id(self, organization_id: UUID, skip: int = 0, limit: int = 100) -> List[User]:
         """Get users by organization ID"""
         try:
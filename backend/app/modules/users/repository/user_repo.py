@@ -13,7 +13,15 @@ from app.middlewares.translation_manager import _
 from app.modules.users.dal.user_dal import UserDAL
 from app.modules.users.models.user_model import User, UserRole, UserStatus
 from app.utils.email_utils import send_password_reset_email, send_verification_email
-from app.utils.security import get_password_hash, verify_password
+from app.utils.security import get_password_hash, invalidate_user_cache, verify_password
+
+# Precompiled validator patterns, bound to module-level names for the hot path
+_email_match = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$").match
+_username_match = re.compile(r"^[a-zA-Z0-9_-]+$").match
+_uppercase_search = re.compile(r"[A-Z]").search
+_lowercase_search = re.compile(r"[a-z]").search
+_digit_search = re.compile(r"\d").search
+_special_char_search = re.compile(r'[!@#$%^&*(),.?":{}|<>]').search
 
 
 class UserRepo:
@@ -26,8 +34,7 @@ class UserRepo:
 
     def _validate_email(self, email: str) -> None:
         """Validate email format"""
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, email):
+        if not _email_match(email):
             raise ValidationException(_("invalid_email_format"))
 
     def _validate_password(self, password: str) -> None:
@@ -36,13 +43,13 @@ class UserRepo:
             raise ValidationException(_("password_too_weak"))
 
         # Check for at least one uppercase, lowercase, digit and special character
-        if not re.search(r"[A-Z]", password):
+        if not _uppercase_search(password):
             raise ValidationException(_("password_needs_uppercase"))
-        if not re.search(r"[a-z]", password):
+        if not _lowercase_search(password):
             raise ValidationException(_("password_needs_lowercase"))
-        if not re.search(r"\d", password):
+        if not _digit_search(password):
             raise ValidationException(_("password_needs_digit"))
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        if not _special_char_search(password):
             raise ValidationException(_("password_needs_special_char"))
 
     def _validate_username(self, username: str) -> None:
@@ -50,9 +57,15 @@ class UserRepo:
         if len(username) < 3 or len(username) > 50:
             raise ValidationException(_("username_length_invalid"))
 
-        if not re.match(r"^[a-zA-Z0-9_-]+$", username):
+        if not _username_match(username):
             raise ValidationException(_("username_format_invalid"))
 
+    def _forget_cached_user(self, user: User) -> User:
+        """Drop the authenticated-user cache entry for a modified user"""
+        if user:
+            invalidate_user_cache(user.email)
+        return user
+
     async def get_user_by_id(self, user_id: UUID) -> User:
         """Get user by ID with validation"""
         user = await self.user_dal.get_by_id(user_id)
@@ -99,18 +112,15 @@ class UserRepo:
         if not email or not username or not password:
             raise ValidationException(_("required_fields_missing"))
 
-        # Validate input
-        self._validate_email(email)
+        # Validate input (email format is enforced by the request schema)
         self._validate_username(username)
         self._validate_password(password)
 
-        # Check for existing users
-        existing_user = await self.user_dal.get_by_email(email)
-        if existing_user:
+        # Check for existing users in a single round-trip
+        conflict = await self.user_dal.find_conflict(email, username)
+        if conflict == "email":
             raise ConflictException(_("email_already_exists"))
-
-        existing_user = await self.user_dal.get_by_username(username)
-        if existing_user:
+        if conflict == "username":
             raise ConflictException(_("username_already_exists"))
 
         # Hash password and create user
@@ -131,7 +141,6 @@ class UserRepo:
 
         # Validate email if provided
         if "email" in update_data:
-            self._validate_email(update_data["email"])
             # Check if email is already taken by another user
             existing_user = await self.user_dal.get_by_email(update_data["email"])
             if existing_user and existing_user.id != user_id:
@@ -151,6 +160,7 @@ class UserRepo:
             update_data["hashed_password"] = get_password_hash(update_data["password"])
             del update_data["password"]
 
+        invalidate_user_cache(user.email)
         return await self.user_dal.update(user_id, update_data)
 
     async def change_password(self, user_id: UUID, current_password: str, new_password: str) -> User:
@@ -166,27 +176,29 @@ class UserRepo:
 
         # Update password
         hashed_password = get_password_hash(new_password)
+        invalidate_user_cache(user.email)
         return await self.user_dal.update_password(user_id, hashed_password)
 
     async def activate_user(self, user_id: UUID) -> User:
         """Activate user account"""
-        return await self.user_dal.update_status(user_id, UserStatus.ACTIVE)
+        return self._forget_cached_user(await self.user_dal.update_status(user_id, UserStatus.ACTIVE))
 
     async def deactivate_user(self, user_id: UUID) -> User:
         """Deactivate user account"""
-        return await self.user_dal.update_status(user_id, UserStatus.INACTIVE)
+        return self._forget_cached_user(await self.user_dal.update_status(user_id, UserStatus.INACTIVE))
 
     async def suspend_user(self, user_id: UUID) -> User:
         """Suspend user account"""
-        return await self.user_dal.update_status(user_id, UserStatus.SUSPENDED)
+        return self._forget_cached_user(await self.user_dal.update_status(user_id, UserStatus.SUSPENDED))
 
     async def verify_user_email(self, user_id: UUID) -> User:
         """Mark user email as verified"""
-        return await self.user_dal.verify_email(user_id)
+        return self._forget_cached_user(await self.user_dal.verify_email(user_id))
 
     async def delete_user(self, user_id: UUID) -> bool:
         """Soft delete user"""
         user = await self.get_user_by_id(user_id)
+        invalidate_user_cache(user.email)
         return await self.user_dal.delete(user_id, soft_delete=True)
 
     async def get_users_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100) -> List[User]:
@@ -207,17 +219,11 @@ class UserRepo:
     async def check_user_permissions(self, user_id: UUID, required_role: UserRole = None) -> bool:
         """Check if user has required permissions"""
         user = await self.get_user_by_id(user_id)
+        return self.check_user_permissions_for(user, required_role)
 
-        if not user.is_active:
-            return False
-
-        if user.is_superuser:
-            return True
-
-        if required_role and user.role != required_role:
-            return False
-
-        return True
+    def check_user_permissions_for(self, user: User, required_role: UserRole = None) -> bool:
+        """Check permissions of an already loaded user without hitting the database"""
+        return user.is_active and (user.is_superuser or not required_role or user.role == required_role)
 
     async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get all users with pagination"""
@@ -3,7 +3,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlmodel import Session, select
 
 from app.core.database import get_session
@@ -77,7 +77,7 @@ async def get_current_admin_user():
     return {"username": "admin", "email": "admin@attendee.dev", "is_admin": True}
 
 
-router = APIRouter(prefix="/admin/users", tags=["Admin - Users"])
+router = APIRouter(prefix="/admin/users", tags=["Admin - Users"], default_response_class=ORJSONResponse)
 
 
 @router.get("/", summary="Admin - Get all users with advanced filtering")
@@ -155,14 +155,14 @@ async def admin_get_users(
         print("🎉 SUCCESS: Returning admin users list")
         print("========================================")
 
-        return JSONResponse(content=response_data, status_code=200)
+        return ORJSONResponse(content=response_data, status_code=200)
 
     except Exception as e:
         print(f"❌ ADMIN GET USERS ERROR: {type(e).__name__}: {str(e)}")
         import traceback
 
         traceback.print_exc()
-        return JSONResponse(content={"error": f"Failed to get users: {str(e)}"}, status_code=500)
+        return ORJSONResponse(content={"error": f"Failed to get users: {str(e)}"}, status_code=500)
 
 
 @router.post("/create", summary="Admin - Create new user")
@@ -205,7 +205,7 @@ async def admin_create_user(
 
         if not email_clean or not username_clean or not password:
             print("❌ VALIDATION FAILED: Required fields missing")
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "success": False,
                     "message": "Required fields missing",
@@ -220,7 +220,7 @@ async def admin_create_user(
         print(f"Email '{email_clean}' exists: {bool(existing_email)}")
         if existing_email:
             print(f"❌ EMAIL CONFLICT: User ID {existing_email.id}")
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "success": False,
                     "message": "Email already exists",
@@ -235,7 +235,7 @@ async def admin_create_user(
         print(f"Username '{username_clean}' exists: {bool(existing_username)}")
         if existing_username:
             print(f"❌ USERNAME CONFLICT: User ID {existing_username.id}")
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "success": False,
                     "message": "Username already exists",
@@ -254,7 +254,7 @@ async def admin_create_user(
                 print(f"✅ Organization ID parsed: {org_id}")
             except ValueError as e:
                 print(f"❌ INVALID ORG ID: '{organization_id}' - {e}")
-                return JSONResponse(
+                return ORJSONResponse(
                     content={
                         "success": False,
                         "message": "Invalid organization ID format",
@@ -342,7 +342,7 @@ async def admin_create_user(
         print("🎉 SUCCESS: Returning 201 response")
         print("========================================")
 
-        return JSONResponse(
+        return ORJSONResponse(
             content=final_response,
             status_code=201,
         )
@@ -351,7 +351,7 @@ async def admin_create_user(
         print(f"❌ VALIDATION EXCEPTION: {str(e)}")
         await db.rollback()
         print("🔄 Database rolled back")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": str(e),
@@ -362,7 +362,7 @@ async def admin_create_user(
         print(f"❌ CONFLICT EXCEPTION: {str(e)}")
         await db.rollback()
         print("🔄 Database rolled back")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": str(e),
@@ -377,7 +377,7 @@ async def admin_create_user(
         traceback.print_exc()
         await db.rollback()
         print("🔄 Database rolled back")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Internal server error: {str(e)}",
@@ -389,7 +389,7 @@ async def admin_create_user(
 @router.get("/{user_id}", summary="Admin - Get user details")
 @handle_exceptions
 async def admin_get_user_details(
-    user_id: str,
+    user_id: UUID,
     db: AsyncSessionWrapper = Depends(get_async_session),
     current_user=Depends(get_current_admin_user),
 ):
@@ -402,11 +402,11 @@ async def admin_get_user_details(
 
     try:
         repo = UserRepo(db)
-        user = await repo.get_user_by_id(UUID(user_id))
+        user = await repo.get_user_by_id(user_id)
 
         if not user:
             print(f"❌ USER NOT FOUND: {user_id}")
-            return JSONResponse(content={"success": False, "message": "User not found"}, status_code=404)
+            return ORJSONResponse(content={"success": False, "message": "User not found"}, status_code=404)
 
         user_data = {
             "id": str(user.id),
@@ -426,11 +426,11 @@ async def admin_get_user_details(
         }
 
         print(f"✅ User details retrieved: {user.email}")
-        return JSONResponse(content={"success": True, "data": user_data}, status_code=200)
+        return ORJSONResponse(content={"success": True, "data": user_data}, status_code=200)
 
     except Exception as e:
         print(f"❌ GET USER DETAILS ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": False, "message": f"Failed to get user: {str(e)}"},
             status_code=500,
         )
@@ -439,7 +439,7 @@ async def admin_get_user_details(
 @router.post("/{user_id}/activate", summary="Admin - Activate user")
 @handle_exceptions
 async def admin_activate_user(
-    user_id: str,
+    user_id: UUID,
     db: AsyncSessionWrapper = Depends(get_async_session),
     current_user=Depends(get_current_admin_user),
 ):
@@ -452,10 +452,10 @@ async def admin_activate_user(
 
     try:
         repo = UserRepo(db)
-        user = await repo.activate_user(UUID(user_id))
+        user = await repo.activate_user(user_id)
 
         print(f"✅ User activated: {user.email}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": f"User {user.email} activated successfully",
@@ -465,7 +465,7 @@ async def admin_activate_user(
 
     except Exception as e:
         print(f"❌ ACTIVATE USER ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": False, "message": f"Failed to activate user: {str(e)}"},
             status_code=500,
         )
@@ -474,7 +474,7 @@ async def admin_activate_user(
 @router.post("/{user_id}/deactivate", summary="Admin - Deactivate user")
 @handle_exceptions
 async def admin_deactivate_user(
-    user_id: str,
+    user_id: UUID,
     db: AsyncSessionWrapper = Depends(get_async_session),
     current_user=Depends(get_current_admin_user),
 ):
@@ -487,10 +487,10 @@ async def admin_deactivate_user(
 
     try:
         repo = UserRepo(db)
-        user = await repo.deactivate_user(UUID(user_id))
+        user = await repo.deactivate_user(user_id)
 
         print(f"✅ User deactivated: {user.email}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": f"User {user.email} deactivated successfully",
@@ -500,7 +500,7 @@ async def admin_deactivate_user(
 
     except Exception as e:
         print(f"❌ DEACTIVATE USER ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": False,
                 "message": f"Failed to deactivate user: {str(e)}",
@@ -512,7 +512,7 @@ async def admin_deactivate_user(
 @router.delete("/{user_id}", summary="Admin - Delete user")
 @handle_exceptions
 async def admin_delete_user(
-    user_id: str,
+    user_id: UUID,
     db: AsyncSessionWrapper = Depends(get_async_session),
     current_user=Depends(get_current_admin_user),
 ):
@@ -525,17 +525,17 @@ async def admin_delete_user(
 
     try:
         repo = UserRepo(db)
-        await repo.delete_user(UUID(user_id))
+        await repo.delete_user(user_id)
 
         print(f"✅ User deleted: {user_id}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": True, "message": "User deleted successfully"},
             status_code=200,
         )
 
     except Exception as e:
         print(f"❌ DELETE USER ERROR: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"success": False, "message": f"Failed to delete user: {str(e)}"},
             status_code=500,
         )
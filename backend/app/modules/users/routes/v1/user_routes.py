@@ -32,6 +32,11 @@ async def create_user(request: CreateUserRequest, repo: UserRepo = Depends(get_u
 async def get_users(request: SearchUserRequest = Depends(), repo: UserRepo = Depends(get_user_repo)) -> APIResponse[PaginatedResponse[UserResponse]]:
     """Get paginated list of users with optional search and filters"""
 
+    # Inputs that can only produce an empty page skip the database entirely
+    if request.page_size <= 0 or request.page < 1 or (request.query is not None and not request.query.strip()):
+        paging_info = PagingInfo(total=0, total_pages=0, page=request.page, page_size=request.page_size)
+        return APIResponse.success(data=PaginatedResponse(items=[], paging=paging_info), message=_("success"))
+
     skip = (request.page - 1) * request.page_size
 
     if request.query:
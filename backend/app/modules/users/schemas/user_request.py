@@ -1,6 +1,8 @@
 from typing import Optional
 from uuid import UUID
 
+from pydantic import EmailStr
+
 from app.core.base_model import FilterableRequestSchema, RequestSchema
 from app.modules.users.models.user_model import UserRole, UserStatus
 
@@ -8,7 +10,7 @@ from app.modules.users.models.user_model import UserRole, UserStatus
 class CreateUserRequest(RequestSchema):
     """Request schema for creating a new user"""
 
-    email: str
+    email: EmailStr
     username: str
     password: str
     first_name: Optional[str] = ""
@@ -20,7 +22,7 @@ class CreateUserRequest(RequestSchema):
 class UpdateUserRequest(RequestSchema):
     """Request schema for updating user information"""
 
-    email: Optional[str] = None
+    email: Optional[EmailStr] = None
     username: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -61,19 +63,19 @@ class UserStatusUpdateRequest(RequestSchema):
 class EmailVerificationRequest(RequestSchema):
     """Request schema for email verification"""
 
-    email: str
+    email: EmailStr
     verification_code: str
 
 
 class ResetPasswordRequest(RequestSchema):
     """Request schema for password reset"""
 
-    email: str
+    email: EmailStr
 
 
 class ConfirmResetPasswordRequest(RequestSchema):
     """Request schema for confirming password reset"""
 
-    email: str
+    email: EmailStr
     reset_code: str
     new_password: str
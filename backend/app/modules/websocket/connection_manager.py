@@ -1,25 +1,80 @@
+import asyncio
 import logging
-from typing import Dict, Set
+import zlib
+from typing import Dict, Set, Union
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for a single client send, so a stalled client gets dropped
+BROADCAST_SEND_TIMEOUT = 5.0
+
+# Pending broadcast messages per connection; a client that falls this far behind is disconnected
+OUTBOUND_QUEUE_SIZE = 256
+
+# Clients that connect with ?compress=zlib get broadcasts larger than this as
+# zlib-compressed binary frames; every other client gets plain JSON text frames
+BROADCAST_COMPRESS_THRESHOLD = 512
+COMPRESS_QUERY_VALUE = "zlib"
+
+
+class _Broadcast:
+    """One encoded broadcast, with its text and compressed forms built at most once"""
+
+    __slots__ = ("payload", "_text", "_compressed")
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self._text = None
+        self._compressed = None
+
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.payload.decode()
+        return self._text
+
+    def for_client(self, compress: bool) -> Union[str, bytes]:
+        """Frame to send to a client, honouring its compression opt-in"""
+        if compress and len(self.payload) > BROADCAST_COMPRESS_THRESHOLD:
+            if self._compressed is None:
+                self._compressed = zlib.compress(self.payload)
+            return self._compressed
+        return self.text()
+
+
+def encode_broadcast(data: dict) -> _Broadcast:
+    """Serialize a broadcast message once for all recipients"""
+    return _Broadcast(orjson.dumps(data))
+
+
+# Fixed envelopes for the high-frequency events; only the variable fields are encoded per call.
+# "timestamp" is emitted as null until events carry one
+_dumps = orjson.dumps
+_BOT_EVENT_PREFIX = b'{"type":"bot_event","bot_id":'
+_TRANSCRIPTION_UPDATE_PREFIX = b'{"type":"transcription_update","bot_id":'
+_WEBHOOK_STATUS_PREFIX = b'{"type":"webhook_status","webhook_id":'
+_ENVELOPE_SUFFIX = b',"timestamp":null}'
+
 
 class ConnectionManager:
     """WebSocket connection manager for real-time communication"""
 
     def __init__(self):
-        # Active connections organized by type
-        self.active_connections: Dict[str, Set[WebSocket]] = {
-            "admin": set(),
-            "bot_monitor": set(),
-            "transcription": set(),
-            "webhook_status": set(),
+        # Active connections organized by type, keyed by id(websocket)
+        self.active_connections: Dict[str, Dict[int, WebSocket]] = {
+            "admin": {},
+            "bot_monitor": {},
+            "transcription": {},
+            "webhook_status": {},
         }
 
-        # Connection metadata
-        self.connection_metadata: Dict[WebSocket, Dict] = {}
+        # Connection metadata, keyed by id(websocket)
+        self.connection_metadata: Dict[int, Dict] = {}
+
+        # Pending close tasks; the loop only keeps weak references to tasks
+        self._close_tasks: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket, connection_type: str, metadata: Dict = None):
         """Accept new WebSocket connection"""
@@ -27,30 +82,68 @@ class ConnectionManager:
 
         # Add to appropriate connection pool
         if connection_type not in self.active_connections:
-            self.active_connections[connection_type] = set()
+            self.active_connections[connection_type] = {}
+
+        self.active_connections[connection_type][id(websocket)] = websocket
 
-        self.active_connections[connection_type].add(websocket)
+        # Broadcasts are queued per connection and drained by a dedicated writer task
+        queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
 
         # Store metadata
-        self.connection_metadata[websocket] = {
+        self.connection_metadata[id(websocket)] = {
             "type": connection_type,
             "metadata": metadata or {},
             "connected_at": None,  # You can add timestamp here
+            "compress": websocket.query_params.get("compress") == COMPRESS_QUERY_VALUE,
+            "queue": queue,
+            "writer": asyncio.create_task(self._writer(websocket, queue)),
         }
 
         logger.info(f"WebSocket connected: type={connection_type}, total={len(self.active_connections[connection_type])}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        # Find and remove from all connection pools
-        for connection_type, connections in self.active_connections.items():
-            if websocket in connections:
-                connections.remove(websocket)
-                logger.info(f"WebSocket disconnected: type={connection_type}, remaining={len(connections)}")
-                break
+        info = self.connection_metadata.pop(id(websocket), None)
+        if info is None:
+            return
+
+        # The metadata records which pool holds the connection
+        connections = self.active_connections.get(info["type"], {})
+        connections.pop(id(websocket), None)
+        logger.info(f"WebSocket disconnected: type={info['type']}, remaining={len(connections)}")
+
+        # Stop the writer task
+        if info.get("writer"):
+            info["writer"].cancel()
+
+    def _drop(self, websocket: WebSocket, code: int, reason: str):
+        """Disconnect a client and close its socket so it notices and reconnects"""
+        self.disconnect(websocket)
+        task = asyncio.create_task(self._close(websocket, code, reason))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int, reason: str):
+        try:
+            await websocket.close(code=code, reason=reason)
+        except Exception as e:
+            # Already closed by the peer or the transport is gone
+            logger.debug(f"WebSocket close failed: {e!r}")
 
-        # Remove metadata
-        self.connection_metadata.pop(websocket, None)
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain queued broadcast messages to a single WebSocket"""
+        while True:
+            message = await queue.get()
+            try:
+                if isinstance(message, bytes):
+                    await asyncio.wait_for(websocket.send_bytes(message), timeout=BROADCAST_SEND_TIMEOUT)
+                else:
+                    await asyncio.wait_for(websocket.send_text(message), timeout=BROADCAST_SEND_TIMEOUT)
+            except Exception as e:
+                logger.error(f"Failed to deliver broadcast: {e!r}")
+                self._drop(websocket, 1011, "broadcast delivery failed")
+                return
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         """Send message to specific WebSocket"""
@@ -68,78 +161,52 @@ class ConnectionManager:
             logger.error(f"Failed to send personal JSON: {e}")
             self.disconnect(websocket)
 
-    async def broadcast_to_type(self, message: str, connection_type: str):
-        """Broadcast message to all connections of specific type"""
+    def _broadcast(self, connection_type: str, message: Union[str, _Broadcast]):
+        """Queue a message on every connection of a type and drop clients whose queue is full"""
         if connection_type not in self.active_connections:
             return
 
-        disconnected = []
-        for websocket in self.active_connections[connection_type].copy():
+        # Snapshot once, since disconnecting below mutates the pool
+        for websocket in tuple(self.active_connections[connection_type].values()):
+            info = self.connection_metadata.get(id(websocket))
+            if info is None:
+                continue
+            frame = message.for_client(info["compress"]) if isinstance(message, _Broadcast) else message
             try:
-                await websocket.send_text(message)
-            except Exception as e:
-                logger.error(f"Failed to broadcast to {connection_type}: {e}")
-                disconnected.append(websocket)
+                info["queue"].put_nowait(frame)
+            except asyncio.QueueFull:
+                logger.error(f"Outbound queue full for {connection_type} connection, disconnecting")
+                self._drop(websocket, 1008, "client too slow")
 
-        # Clean up disconnected websockets
-        for websocket in disconnected:
-            self.disconnect(websocket)
+    async def broadcast_to_type(self, message: str, connection_type: str):
+        """Broadcast message to all connections of specific type"""
+        self._broadcast(connection_type, message)
 
     async def broadcast_json_to_type(self, data: dict, connection_type: str):
         """Broadcast JSON data to all connections of specific type"""
-        if connection_type not in self.active_connections:
-            return
-
-        disconnected = []
-        for websocket in self.active_connections[connection_type].copy():
-            try:
-                await websocket.send_json(data)
-            except Exception as e:
-                logger.error(f"Failed to broadcast JSON to {connection_type}: {e}")
-                disconnected.append(websocket)
-
-        # Clean up disconnected websockets
-        for websocket in disconnected:
-            self.disconnect(websocket)
+        self._broadcast(connection_type, encode_broadcast(data))
 
     async def broadcast_bot_event(self, bot_id: str, event_type: str, event_data: dict):
         """Broadcast bot-related events"""
-        message = {
-            "type": "bot_event",
-            "bot_id": bot_id,
-            "event_type": event_type,
-            "data": event_data,
-            "timestamp": None,  # You can add timestamp here
-        }
+        payload = _Broadcast(b"".join((_BOT_EVENT_PREFIX, _dumps(bot_id), b',"event_type":', _dumps(event_type), b',"data":', _dumps(event_data), _ENVELOPE_SUFFIX)))
 
         # Send to admin and bot_monitor connections
-        await self.broadcast_json_to_type(message, "admin")
-        await self.broadcast_json_to_type(message, "bot_monitor")
+        self._broadcast("admin", payload)
+        self._broadcast("bot_monitor", payload)
 
     async def broadcast_transcription_update(self, bot_id: str, transcription_data: dict):
         """Broadcast transcription updates"""
-        message = {
-            "type": "transcription_update",
-            "bot_id": bot_id,
-            "data": transcription_data,
-            "timestamp": None,  # You can add timestamp here
-        }
+        payload = _Broadcast(b"".join((_TRANSCRIPTION_UPDATE_PREFIX, _dumps(bot_id), b',"data":', _dumps(transcription_data), _ENVELOPE_SUFFIX)))
 
-        await self.broadcast_json_to_type(message, "transcription")
-        await self.broadcast_json_to_type(message, "admin")
+        self._broadcast("transcription", payload)
+        self._broadcast("admin", payload)
 
     async def broadcast_webhook_status(self, webhook_id: str, status: str, details: dict):
         """Broadcast webhook delivery status"""
-        message = {
-            "type": "webhook_status",
-            "webhook_id": webhook_id,
-            "status": status,
-            "details": details,
-            "timestamp": None,  # You can add timestamp here
-        }
+        payload = _Broadcast(b"".join((_WEBHOOK_STATUS_PREFIX, _dumps(webhook_id), b',"status":', _dumps(status), b',"details":', _dumps(details), _ENVELOPE_SUFFIX)))
 
-        await self.broadcast_json_to_type(message, "webhook_status")
-        await self.broadcast_json_to_type(message, "admin")
+        self._broadcast("webhook_status", payload)
+        self._broadcast("admin", payload)
 
     def get_connection_stats(self) -> dict:
         """Get connection statistics"""
@@ -1,10 +1,19 @@
+import base64
+import calendar
+import hashlib
+import hmac
+import json
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import select
 
 from app.core.config import settings
@@ -14,6 +23,29 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Key ids carried in the JWT header so decoding can pick the right secret directly
+ACCESS_TOKEN_KID = "std"
+LIFETIME_TOKEN_KID = "life"
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The JWT headers and signing key are constant, so encode them once at import
+_JWT_HEADERS_B64 = {kid: _b64url(json.dumps({"alg": ALGORITHM, "typ": "JWT", "kid": kid}, separators=(",", ":")).encode()) for kid in (ACCESS_TOKEN_KID, LIFETIME_TOKEN_KID)}
+_SIGNING_KEY = settings.SECRET_KEY.encode()
+
+
+def _encode_hs256(claims: dict, key: bytes, kid: str) -> str:
+    """Sign claims as an HS256 JWT using the pre-encoded header"""
+    exp = claims.get("exp")
+    if isinstance(exp, datetime):
+        claims["exp"] = calendar.timegm(exp.utctimetuple())
+    signing_input = _JWT_HEADERS_B64[kid] + b"." + _b64url(json.dumps(claims, separators=(",", ":")).encode())
+    signature = hmac.new(key, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -30,17 +62,34 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    return _encode_hs256(to_encode, _SIGNING_KEY, ACCESS_TOKEN_KID)
 
 
-def decode_access_token(token: str):
+# Verified token payloads; entries are also dropped once the token's own exp has passed
+_jwt_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+
+
+def _decode_cached(token: str, secret_key: str):
+    """Decode and verify a token, reusing the payload of a recently verified one"""
+    key = hashlib.blake2b(secret_key.encode() + b"\0" + token.encode(), digest_size=16).digest()
+    cached = _jwt_cache.get(key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
     except JWTError:
         return None
 
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _jwt_cache[key] = (payload, exp)
+    return payload
+
+
+def decode_access_token(token: str):
+    return _decode_cached(token, settings.SECRET_KEY)
+
 
 def create_lifetime_token(data: dict, secret_key: str) -> str:
     """Create a token that never expires for testing purposes"""
@@ -48,38 +97,73 @@ def create_lifetime_token(data: dict, secret_key: str) -> str:
     # Add a very far future expiration date (100 years from now)
     expire = datetime.utcnow() + timedelta(days=365 * 100)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=ALGORITHM)
-    return encoded_jwt
+    return _encode_hs256(to_encode, secret_key.encode(), LIFETIME_TOKEN_KID)
 
 
 def decode_lifetime_token(token: str, secret_key: str):
     """Decode a lifetime token"""
-    try:
-        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
-        return None
+    return _decode_cached(token, secret_key)
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+# Immutable column snapshots of recently authenticated users. Invalidation only
+# reaches this worker, so the short TTL bounds how long another worker can keep
+# authorizing a user after a role or status change
+_user_cache: TTLCache = TTLCache(maxsize=10000, ttl=5)
+
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    from app.core.database import get_session
+def invalidate_user_cache(email: str) -> None:
+    """Drop a cached user so the next request reloads it from the database"""
+    _user_cache.pop(email, None)
+
+
+# Resolved on first use: importing them at module level would be circular
+# (database -> users package -> user_repo -> security)
+_User = None
+_async_session_factory = None
+
+
+def _load_user_lookup():
+    """Import the User model and session factory once"""
+    global _User, _async_session_factory
+    from app.core.database import async_session_factory
     from app.modules.users.models import User
 
+    _User, _async_session_factory = User, async_session_factory
+
+
+def _snapshot(user) -> tuple:
+    """Column values of a loaded user, safe to share across requests"""
+    return tuple((column.key, getattr(user, column.key)) for column in _User.__table__.columns)
+
+
+def _from_snapshot(snapshot: tuple):
+    """Fresh detached User for one request, so no instance is shared between requests"""
+    user = _User(**dict(snapshot))
+    make_transient_to_detached(user)
+    return user
+
+
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    # First try to decode with regular secret
-    payload = decode_access_token(token)
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except JWTError:
+        raise credentials_exception
 
-    # If that fails, try with lifetime token secret
-    if payload is None:
+    # The key id selects the secret; tokens issued without one fall back to trying both
+    if kid == LIFETIME_TOKEN_KID:
         payload = decode_lifetime_token(token, settings.LIFETIME_TOKEN_SECRET)
+    else:
+        payload = decode_access_token(token)
+        if payload is None and kid is None:
+            payload = decode_lifetime_token(token, settings.LIFETIME_TOKEN_SECRET)
 
     if payload is None:
         raise credentials_exception
@@ -88,8 +172,28 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     if email is None:
         raise credentials_exception
 
-    async for session in get_session():
-        user = (await session.exec(select(User).where(User.email == email))).first()
-        if user is None:
-            raise credentials_exception
-        return user
+    snapshot = _user_cache.get(email)
+    if snapshot is not None:
+        return _from_snapshot(snapshot)
+
+    if _User is None:
+        _load_user_lookup()
+
+    # email is unique-indexed, so this is a single index probe
+    query = select(_User).where(_User.email == email).limit(1)
+
+    # Share the route's session when an async session dependency already ran for this
+    # request; a sync session would block the event loop, so it gets a short-lived async one
+    session = getattr(request.state, "db_session", None)
+    if isinstance(session, AsyncSession):
+        user = (await session.execute(query)).scalar_one_or_none()
+    else:
+        async with _async_session_factory() as session:
+            user = (await session.execute(query)).scalar_one_or_none()
+    if user is None:
+        raise credentials_exception
+
+    # Hits and misses both hand out a detached copy, so callers see the same object either way
+    snapshot = _snapshot(user)
+    _user_cache[email] = snapshot
+    return _from_snapshot(snapshot)